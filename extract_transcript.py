@@ -1,55 +1,346 @@
 import os
 import json
 import re
+import html
+import gzip
+import hashlib
+import asyncio
+import functools
 import time
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse, parse_qs
+from html.parser import HTMLParser
 
 # Install required packages:
-# pip install youtube-transcript-api requests beautifulsoup4 lxml
+# pip install youtube-transcript-api requests
+# (youtube-transcript-api is imported on first use, see _transcript_api)
 
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-    from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
-    from youtube_transcript_api.formatters import TextFormatter, JSONFormatter
+    import orjson
 except ImportError:
-    print("Please install youtube-transcript-api: pip install youtube-transcript-api")
-    exit(1)
+    orjson = None
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("Please install beautifulsoup4: pip install beautifulsoup4")
-    exit(1)
+# orjson parses several times faster than the stdlib; fall back when it is missing
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def loads_json(data):
+    """Parse JSON from bytes or str, with orjson when it is installed"""
+    return _json_loads(data)
+
+def dumps_json(data, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes
+
+    Uses orjson's C serializer when it is installed, otherwise the stdlib json
+    module with the same layout (2-space indent, non-ASCII kept as-is).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def write_json(filepath: str, data, indent: bool = True) -> None:
+    """Write data to a UTF-8 JSON file with a single buffered binary write"""
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        f.write(dumps_json(data, indent))
+
+# Video IDs are 11 characters from [A-Za-z0-9_-]; one pattern covers watch,
+# youtu.be, embed, /v/ and shorts URLs (the host is checked separately)
+_YOUTUBE_HOSTS = frozenset(['youtube.com', 'youtu.be'])  # plus any *.youtube.com (www, m, music)
+_VIDEO_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/|/v/|/shorts/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])')
+
+# Patterns for the few watch-page fields we need; they run on the raw response
+# bytes so the ~1MB page never has to be decoded or parsed into a tree.
+_OG_TITLE_RE = re.compile(rb'<meta[^>]+property="og:title"[^>]+content="([^"]*)"')
+_OG_DESCRIPTION_RE = re.compile(rb'<meta[^>]+property="og:description"[^>]+content="([^"]*)"')
+_DURATION_META_RE = re.compile(rb'<meta[^>]+itemprop="duration"[^>]+content="([^"]*)"')
+_KEYWORDS_META_RE = re.compile(rb'<meta[^>]+name="keywords"[^>]+content="([^"]*)"')
+_LD_JSON_RE = re.compile(rb'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+_PLAYER_RESPONSE_RE = re.compile(rb'ytInitialPlayerResponse\s*=\s*(?={)')
+_JSON_DECODER = json.JSONDecoder()
+_ISO_DURATION_RE = re.compile(r'PT(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?')
+
+# Returned by extract_and_save when no transcript could be fetched
+_EXTRACTION_FAILED_MSG = "\n".join([
+    "Could not extract transcript. Possible reasons:",
+    "- Video has no captions/subtitles available",
+    "- Video is private or restricted",
+    "- Transcripts are disabled for this video",
+    "- Video is unavailable",
+])
+
+# Keep-alive connections kept per host; must cover the largest worker count
+# used by extract_many / extract_many_async
+_HTTP_POOL_SIZE = 50
+
+# How long a TranscriptList is reused in memory; caption track URLs in it expire
+_TRANSCRIPT_LIST_TTL = 10 * 60
+
+# The watch page is streamed; reading stops once the player response has been
+# received (see _read_page) and never goes beyond the cap
+_PLAYER_RESPONSE_MARKER = b'ytInitialPlayerResponse = '
+_PAGE_CHUNK_SIZE = 64 * 1024
+_MAX_PAGE_BYTES = 4 * 1024 * 1024
+
+# Minimum gap between requests to youtube.com, across all threads
+_MIN_REQUEST_INTERVAL = 0.3
+
+# Video metadata (title, views, ...) changes more often than transcripts
+_METADATA_CACHE_TTL = 24 * 60 * 60
+
+# Default language priority - comprehensive list
+_DEFAULT_LANGUAGES = (
+    'en', 'en-US', 'en-GB', 'en-CA', 'en-AU',  # English variants
+    'es', 'es-ES', 'es-MX', 'es-AR',           # Spanish variants
+    'fr', 'fr-FR', 'fr-CA',                    # French variants
+    'de', 'de-DE', 'de-AT', 'de-CH',          # German variants
+    'it', 'it-IT',                            # Italian
+    'pt', 'pt-BR', 'pt-PT',                   # Portuguese variants
+    'ru', 'ru-RU',                            # Russian
+    'ja', 'ja-JP',                            # Japanese
+    'ko', 'ko-KR',                            # Korean
+    'zh', 'zh-CN', 'zh-TW', 'zh-HK',         # Chinese variants
+    'hi', 'hi-IN',                            # Hindi
+    'ar', 'ar-SA',                            # Arabic
+    'nl', 'nl-NL', 'nl-BE',                   # Dutch
+    'sv', 'sv-SE',                            # Swedish
+    'no', 'nb-NO', 'nn-NO',                   # Norwegian
+    'da', 'da-DK',                            # Danish
+    'fi', 'fi-FI',                            # Finnish
+    'pl', 'pl-PL',                            # Polish
+    'tr', 'tr-TR',                            # Turkish
+    'he', 'he-IL',                            # Hebrew
+    'th', 'th-TH',                            # Thai
+    'vi', 'vi-VN',                            # Vietnamese
+    'id', 'id-ID',                            # Indonesian
+    'ms', 'ms-MY',                            # Malay
+    'tl', 'tl-PH',                            # Filipino
+    'uk', 'uk-UA',                            # Ukrainian
+    'cs', 'cs-CZ',                            # Czech
+    'sk', 'sk-SK',                            # Slovak
+    'hu', 'hu-HU',                            # Hungarian
+    'ro', 'ro-RO',                            # Romanian
+    'bg', 'bg-BG',                            # Bulgarian
+    'hr', 'hr-HR',                            # Croatian
+    'sr', 'sr-RS',                            # Serbian
+    'sl', 'sl-SI',                            # Slovenian
+    'et', 'et-EE',                            # Estonian
+    'lv', 'lv-LV',                            # Latvian
+    'lt', 'lt-LT',                            # Lithuanian
+    'el', 'el-GR',                            # Greek
+    'mt', 'mt-MT',                            # Maltese
+)
+
+def _parse_iso8601_duration(duration_str: Optional[str]) -> int:
+    """Convert an ISO 8601 duration such as PT1H4M33S to seconds (0 if missing or malformed)"""
+    # fullmatch so values with trailing junk (e.g. PT4M33.5S) are rejected instead of half-parsed
+    if not duration_str:
+        return 0
+    match = _ISO_DURATION_RE.fullmatch(duration_str.strip())
+    if not match:
+        return 0
+    parts = match.groupdict(default='0')
+    return int(parts['hours']) * 3600 + int(parts['minutes']) * 60 + int(parts['seconds'])
+
+def _create_session() -> requests.Session:
+    """
+    Build the HTTP session shared by every extractor instance
+
+    Keep-alive connections are pooled per host, so the watch page and the
+    transcript endpoints on youtube.com reuse the same TCP/TLS connections.
+    requests.Session is safe to share across threads for plain GETs.
+    """
+    session = requests.Session()
+    # Add headers to mimic a real browser
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        # 'gzip,deflate' plus 'br' when brotli is installed, so we never
+        # advertise an encoding urllib3 cannot decode
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    })
+    # Exponential backoff (1s, 2s, 4s) on rate limiting and server errors,
+    # honouring Retry-After when YouTube sends it
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Only retry idempotent reads; never replay a POST
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        # Hand back the last 429/5xx response so raise_for_status() reports
+        # the real status instead of an opaque MaxRetryError
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+SESSION = _create_session()
+
+def _read_page(chunks: Iterable[bytes], page: bytes = b'', stop_after: Optional[bytes] = None) -> bytes:
+    """
+    Accumulate a streamed response body, capped at _MAX_PAGE_BYTES
+
+    Args:
+        chunks: Decoded body chunks (response.iter_content)
+        page: Bytes already read from the same response
+        stop_after: Stop once this marker has been seen and the <script> containing it has closed
+
+    Returns:
+        The bytes read so far
+    """
+    buffer = bytearray(page)
+    marker_at = -1
+    search_from = 0
+    for chunk in chunks:
+        buffer += chunk
+        if stop_after is not None:
+            if marker_at == -1:
+                # Overlap the previous chunk so a marker split across chunks is still found
+                marker_at = buffer.find(stop_after, max(0, search_from - len(stop_after)))
+                search_from = len(buffer)
+            if marker_at != -1 and buffer.find(b'</script>', marker_at) != -1:
+                break
+        if len(buffer) >= _MAX_PAGE_BYTES:
+            break
+    return bytes(buffer)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_video_id(url: str) -> Optional[str]:
+    """Video ID contained in a YouTube URL; memoized because batch runs repeat URLs"""
+    # Scheme-less input such as "youtu.be/abc" still has its host recognised
+    host = (urlparse(url if '//' in url else f"//{url}").hostname or '').lower()
+    if host not in _YOUTUBE_HOSTS and not host.endswith('.youtube.com'):
+        return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+class _MetaTagParser(HTMLParser):
+    """Collects <meta> content values keyed by their property, name or itemprop"""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'meta':
+            return
+        attributes = dict(attrs)
+        key = attributes.get('property') or attributes.get('name') or attributes.get('itemprop')
+        if key and key not in self.tags:
+            self.tags[key] = attributes.get('content') or ''
+
+class _RateLimiter:
+    """
+    Space requests at least min_interval seconds apart across all threads
+
+    Each caller reserves the next free slot under the lock and sleeps outside
+    it, so concurrent extractions queue up behind one shared schedule instead
+    of each paying its own fixed delay.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+# Shared by every extractor that doesn't set its own rate_limit_delay
+_YOUTUBE_RATE_LIMITER = _RateLimiter(_MIN_REQUEST_INTERVAL)
+
+@functools.lru_cache(maxsize=None)
+def _transcript_api() -> SimpleNamespace:
+    """
+    Import youtube-transcript-api on first use
+
+    The import is deferred so the interactive menu and modules that only need
+    helpers such as write_json start without loading it.
+
+    Returns:
+        Namespace with list_transcripts(video_id) and the library's error classes
+    """
+    try:
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+    except ImportError:
+        print("Please install youtube-transcript-api: pip install youtube-transcript-api")
+        exit(1)
+
+    # youtube-transcript-api >= 1.0 is instance based and accepts our session as
+    # its HTTP client; older releases only expose the static list_transcripts().
+    if hasattr(YouTubeTranscriptApi, 'list'):
+        list_transcripts = YouTubeTranscriptApi(http_client=SESSION).list
+    else:
+        list_transcripts = YouTubeTranscriptApi.list_transcripts
+
+    return SimpleNamespace(
+        list_transcripts=list_transcripts,
+        TranscriptsDisabled=TranscriptsDisabled,
+        NoTranscriptFound=NoTranscriptFound,
+        VideoUnavailable=VideoUnavailable,
+    )
+
+def _list_transcripts(video_id: str):
+    """List the transcripts of a video over the shared session when supported"""
+    return _transcript_api().list_transcripts(video_id)
 
 class YouTubeTranscriptExtractor:
-    def __init__(self, storage_dir: str = "transcripts"):
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = ('storage_dir', 'cache_ttl', 'metadata_source', 'compress_output', 'store_text_fields', 'session',
+                 'rate_limiter', '_transcript_lists', '_transcript_lists_lock')
+
+    def __init__(self, storage_dir: str = "transcripts", cache_ttl: float = 24 * 60 * 60, metadata_source: str = "page",
+                 compress_output: bool = False, store_text_fields: bool = True, rate_limit_delay: Optional[float] = None):
         """
         Initialize the YouTube Transcript Extractor focusing on YouTube Transcript API
 
         Args:
             storage_dir: Directory to store extracted transcripts
+            cache_ttl: Seconds an extracted transcript is reused from the on-disk cache (0 disables it)
+            metadata_source: "page" to scrape the full watch page, or "oembed" for the
+                lightweight oEmbed endpoint (title and channel only, no upload date or views)
+            compress_output: Save transcripts as gzip-compressed .json.gz files
+            store_text_fields: Keep transcript_formatted/transcript_plain in saved files; when
+                False only transcript_raw is written and readers rebuild the text from it
+            rate_limit_delay: Minimum seconds between this extractor's requests to YouTube. None shares
+                the module-wide limiter (_MIN_REQUEST_INTERVAL); 0 disables spacing
         """
         self.storage_dir = storage_dir
-        self.session = requests.Session()
-        # Add headers to mimic a real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.cache_ttl = cache_ttl
+        self.metadata_source = metadata_source
+        self.compress_output = compress_output
+        self.store_text_fields = store_text_fields
+        self.session = SESSION
+        # Only delays when requests arrive faster than the interval, never a single request
+        self.rate_limiter = _YOUTUBE_RATE_LIMITER if rate_limit_delay is None else _RateLimiter(rate_limit_delay)
+        # video_id -> (fetched_at, TranscriptList), see list_transcripts
+        self._transcript_lists = {}
+        self._transcript_lists_lock = threading.Lock()
         self.ensure_storage_dir()
 
     def ensure_storage_dir(self):
         """Create storage directory if it doesn't exist"""
-        if not os.path.exists(self.storage_dir):
-            os.makedirs(self.storage_dir)
+        os.makedirs(self.storage_dir, exist_ok=True)
 
     def extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -61,21 +352,51 @@ class YouTubeTranscriptExtractor:
         Returns:
             Video ID string or None if invalid
         """
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/)([^&\n?#]+)',
-            r'youtube\.com\/watch\?.*v=([^&\n?#]+)',
-        ]
+        return _parse_video_id(url)
 
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+    def extract_video_ids(self, urls: Iterable[str]) -> List[Optional[str]]:
+        """
+        Extract video IDs from many URLs
 
-        return None
+        Args:
+            urls: YouTube video URLs
 
-    def get_video_info_from_page(self, video_id: str) -> Dict:
+        Returns:
+            One video ID per URL, in order, with None for invalid URLs
         """
-        Extract basic video information from YouTube page
+        return [_parse_video_id(url) for url in urls]
+
+    def get_video_info(self, video_id: str, force_refresh: bool = False) -> Dict:
+        """
+        Get video metadata from the configured metadata source
+
+        Results are cached on disk for _METADATA_CACHE_TTL, so re-extracting a
+        video with different transcript options does not refetch its page.
+        force_refresh skips the cached copy (a fresh result still replaces it).
+        """
+        cache_path = os.path.join(self.storage_dir, '.cache', f"{video_id}_meta_{self.metadata_source}.json.gz")
+        if not force_refresh:
+            cached = self._load_cached(cache_path, min(self.cache_ttl, _METADATA_CACHE_TTL))
+            if cached is not None:
+                return cached
+
+        if self.metadata_source == "oembed":
+            metadata = self.get_video_info_from_oembed(video_id)
+        else:
+            metadata = self.get_video_info_from_page(video_id)
+
+        # Failed lookups return the 'Unknown Title' placeholder; don't pin those
+        if metadata.get('title') != 'Unknown Title':
+            self._store_cached(cache_path, metadata)
+        return metadata
+
+    def get_video_info_from_oembed(self, video_id: str) -> Dict:
+        """
+        Get basic video information from YouTube's oEmbed endpoint
+
+        The response is a few hundred bytes of JSON instead of the ~1MB watch
+        page. It has no description, duration, upload date or view count;
+        extract_and_save fills the duration in from the transcript timing.
 
         Args:
             video_id: YouTube video ID
@@ -84,93 +405,271 @@ class YouTubeTranscriptExtractor:
             Dictionary containing video information
         """
         try:
-            url = f"https://www.youtube.com/watch?v={video_id}"
+            self.rate_limiter.wait()
+            response = self.session.get(
+                "https://www.youtube.com/oembed",
+                params={'url': f"https://www.youtube.com/watch?v={video_id}", 'format': 'json'},
+                timeout=10
+            )
+            response.raise_for_status()
+            info = _json_loads(response.content)
 
-            # Add random delay to avoid rate limiting
-            time.sleep(random.uniform(1, 3))
+            return {
+                'title': info.get('title') or 'Unknown Title',
+                'description': '',
+                'duration': 0,
+                'upload_date': '',
+                'view_count': 0,
+                'author': info.get('author_name', '')
+            }
 
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+        except Exception as e:
+            print(f"Error getting video info: {str(e)}")
+            return {'title': 'Unknown Title', 'description': '', 'duration': 0}
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def get_video_info_from_page(self, video_id: str) -> Dict:
+        """
+        Extract basic video information from YouTube page
 
-            # Extract title
-            title_tag = soup.find('meta', property='og:title')
-            title = title_tag['content'] if title_tag else 'Unknown Title'
+        Args:
+            video_id: YouTube video ID
 
-            # Extract description
-            desc_tag = soup.find('meta', property='og:description')
-            description = desc_tag['content'] if desc_tag else ''
+        Returns:
+            Dictionary containing video information
+        """
+        try:
+            url = f"https://www.youtube.com/watch?v={video_id}"
 
-            # Extract duration from meta tag
-            duration = 0
+            # Requests are spaced by the shared rate limiter; the session's retry
+            # policy additionally backs off when YouTube answers 429/5xx
+            self.rate_limiter.wait()
+            response = self.session.get(url, timeout=10, stream=True)
             try:
-                duration_tag = soup.find('meta', itemprop='duration')
-                if duration_tag:
-                    duration_str = duration_tag.get('content', '')
-                    # Parse ISO 8601 duration (PT4M33S)
-                    if duration_str.startswith('PT'):
-                        duration_str = duration_str[2:]  # Remove PT
-                        duration = 0
-                        if 'H' in duration_str:
-                            parts = duration_str.split('H')
-                            duration += int(parts[0]) * 3600
-                            duration_str = parts[1]
-                        if 'M' in duration_str:
-                            parts = duration_str.split('M')
-                            duration += int(parts[0]) * 60
-                            duration_str = parts[1]
-                        if 'S' in duration_str:
-                            duration += int(duration_str.replace('S', ''))
-            except:
-                pass
-
-            # Extract upload date and view count from JSON-LD
+                response.raise_for_status()
+                chunks = response.iter_content(chunk_size=_PAGE_CHUNK_SIZE)
+
+                # The embedded player response carries every field in one JSON
+                # object and sits in the first part of the page, so stop reading
+                # once its script has closed
+                page = _read_page(chunks, stop_after=_PLAYER_RESPONSE_MARKER)
+                info = self._parse_player_response(page)
+                if info is not None:
+                    return info
+
+                # The fallbacks below need meta and ld+json tags further down
+                page = _read_page(chunks, page)
+            finally:
+                # Abandoning the rest of the body costs this connection its
+                # keep-alive, which is far cheaper than downloading ~1MB of HTML
+                response.close()
+
+            # Extract title, description and duration from the meta tags
+            title_match = _OG_TITLE_RE.search(page)
+            desc_match = _OG_DESCRIPTION_RE.search(page)
+            duration_match = _DURATION_META_RE.search(page)
+            keywords_match = _KEYWORDS_META_RE.search(page)
+            title = html.unescape(title_match.group(1).decode('utf-8', 'replace')) if title_match else None
+            description = html.unescape(desc_match.group(1).decode('utf-8', 'replace')) if desc_match else None
+            duration_str = duration_match.group(1).decode('ascii', 'ignore') if duration_match else None
+            keywords_str = html.unescape(keywords_match.group(1).decode('utf-8', 'replace')) if keywords_match else None
+
+            # The regexes expect YouTube's usual attribute order; if the page
+            # is laid out differently fall back to a real (C) HTML parser
+            if title is None:
+                tags = self._parse_meta_tags(page)
+                title = tags.get('og:title')
+                description = description if description is not None else tags.get('og:description')
+                duration_str = duration_str if duration_str is not None else tags.get('duration')
+                keywords_str = keywords_str if keywords_str is not None else tags.get('keywords')
+
+            title = title or 'Unknown Title'
+            description = description or ''
+            keywords = [keyword.strip() for keyword in keywords_str.split(',') if keyword.strip()] if keywords_str else []
+
+            duration = _parse_iso8601_duration(duration_str)
+
+            # Extract upload date and view count from JSON-LD. They may sit in
+            # different blocks, so keep scanning until both have been found.
             upload_date = ''
             view_count = 0
-            try:
-                scripts = soup.find_all('script', type='application/ld+json')
-                for script in scripts:
+            found_date = found_views = False
+            for script_match in _LD_JSON_RE.finditer(page):
+                blob = script_match.group(1)
+                # Most ld+json blocks are unrelated schemas; skip them before parsing
+                if b'"uploadDate"' not in blob and b'"interactionStatistic"' not in blob:
+                    continue
+                try:
+                    data = _json_loads(blob)
+                except ValueError:  # json and orjson decode errors both subclass it
+                    continue
+                if isinstance(data, list):
+                    data = data[0] if data else {}
+                if not isinstance(data, dict):
+                    continue
+
+                if not found_date and 'uploadDate' in data:
+                    upload_date = data['uploadDate']
+                    found_date = True
+                # The VideoObject repeats the duration; use it when the meta tag was missing
+                if not duration and isinstance(data.get('duration'), str):
+                    duration = _parse_iso8601_duration(data['duration'])
+                if not found_views and 'interactionStatistic' in data:
                     try:
-                        data = json.loads(script.string)
-                        if isinstance(data, list):
-                            data = data[0]
-                        if 'uploadDate' in data:
-                            upload_date = data['uploadDate']
-                        if 'interactionStatistic' in data:
-                            for stat in data['interactionStatistic']:
-                                if stat.get('interactionType', {}).get('@type') == 'WatchAction':
-                                    view_count = int(stat.get('userInteractionCount', 0))
-                        break
-                    except:
-                        continue
-            except:
-                pass
+                        for stat in data['interactionStatistic']:
+                            if stat.get('interactionType', {}).get('@type') == 'WatchAction':
+                                view_count = int(stat.get('userInteractionCount', 0))
+                                found_views = True
+                                break
+                    except (AttributeError, KeyError, TypeError, ValueError):
+                        pass
+                if found_date and found_views:
+                    break
 
             return {
                 'title': title,
                 'description': description,
                 'duration': duration,
                 'upload_date': upload_date,
-                'view_count': view_count
+                'view_count': view_count,
+                'keywords': keywords
             }
 
         except Exception as e:
             print(f"Error getting video info: {str(e)}")
             return {'title': 'Unknown Title', 'description': '', 'duration': 0}
 
-    def get_available_transcripts(self, video_id: str) -> Dict:
+    def _parse_player_response(self, page: bytes) -> Optional[Dict]:
+        """
+        Read video information from the page's ytInitialPlayerResponse JSON
+
+        The marker is located with bytes.find (a plain C substring scan) and
+        the regex only checks for the assignment at each hit. The object is
+        then decoded in place with raw_decode, which stops at the end of the
+        object instead of needing the rest of the inline script cut off first.
+
+        Returns:
+            Dictionary containing video information, or None if the page has no usable player response
+        """
+        match = None
+        start = page.find(b'ytInitialPlayerResponse')
+        while start != -1:
+            # The name also appears in non-assignment contexts, e.g. window["ytInitialPlayerResponse"]
+            match = _PLAYER_RESPONSE_RE.match(page, start)
+            if match:
+                break
+            start = page.find(b'ytInitialPlayerResponse', start + 1)
+        if not match:
+            return None
+        try:
+            player = _JSON_DECODER.raw_decode(page[match.end():].decode('utf-8', 'replace'))[0]
+            details = player['videoDetails']
+        except (ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(details, dict) or not details.get('title'):
+            return None
+
+        microformat = player.get('microformat', {}).get('playerMicroformatRenderer', {})
+        try:
+            duration = int(details.get('lengthSeconds') or 0)
+            view_count = int(details.get('viewCount') or 0)
+        except (TypeError, ValueError):
+            duration, view_count = 0, 0
+
+        return {
+            'title': details['title'],
+            'description': details.get('shortDescription', ''),
+            'duration': duration,
+            'upload_date': microformat.get('uploadDate') or microformat.get('publishDate', ''),
+            'view_count': view_count,
+            'author': details.get('author', ''),
+            'category': microformat.get('category', ''),
+            'keywords': details.get('keywords', [])
+        }
+
+    def _parse_meta_tags(self, page: bytes) -> Dict[str, str]:
+        """
+        Read og:title, og:description, itemprop=duration and keywords with lxml
+
+        Only used when the precompiled regexes miss. lxml is a libxml2 (C)
+        parser, so even this slow path avoids pure-Python tokenizing. Without
+        lxml a stdlib HTMLParser subclass records only the meta tags.
+
+        Returns:
+            Dictionary of the meta values found
+        """
+        try:
+            import lxml.html
+        except ImportError:
+            return self._parse_meta_tags_stdlib(page)
+
+        try:
+            tree = lxml.html.fromstring(page)
+        except Exception as e:
+            print(f"Error parsing video page: {str(e)}")
+            return {}
+
+        tags = {}
+        for key, query in (
+            ('og:title', 'string(//meta[@property="og:title"]/@content)'),
+            ('og:description', 'string(//meta[@property="og:description"]/@content)'),
+            ('duration', 'string(//meta[@itemprop="duration"]/@content)'),
+            ('keywords', 'string(//meta[@name="keywords"]/@content)'),
+        ):
+            value = tree.xpath(query)
+            if value:
+                tags[key] = value
+        return tags
+
+    def _parse_meta_tags_stdlib(self, page: bytes) -> Dict[str, str]:
+        """Pure-Python fallback for _parse_meta_tags when lxml is not installed"""
+        # Only meta tags are recorded, so no tree is built for the rest of the page
+        parser = _MetaTagParser()
+        try:
+            parser.feed(page.decode('utf-8', 'replace'))
+        except Exception as e:
+            print(f"Error parsing video page: {str(e)}")
+            return {}
+
+        return {key: parser.tags[key] for key in ('og:title', 'og:description', 'duration', 'keywords') if parser.tags.get(key)}
+
+    def list_transcripts(self, video_id: str, force_refresh: bool = False):
+        """
+        List the transcripts of a video, reusing a listing fetched in the last few minutes
+
+        get_available_transcripts and extract_transcript_youtube_api both need
+        the listing; keeping it briefly per instance lets them (and repeated
+        extractions with different options) share one network round-trip.
+        force_refresh always fetches a new listing.
+        """
+        now = time.monotonic()
+        with self._transcript_lists_lock:
+            entry = self._transcript_lists.get(video_id)
+        if not force_refresh and entry is not None and now - entry[0] < _TRANSCRIPT_LIST_TTL:
+            return entry[1]
+
+        self.rate_limiter.wait()
+        transcript_list = _list_transcripts(video_id)
+        with self._transcript_lists_lock:
+            # Drop expired listings so long batch runs don't accumulate them
+            for stale_id in [vid for vid, (fetched_at, _) in self._transcript_lists.items() if now - fetched_at >= _TRANSCRIPT_LIST_TTL]:
+                del self._transcript_lists[stale_id]
+            self._transcript_lists[video_id] = (now, transcript_list)
+        return transcript_list
+
+    def get_available_transcripts(self, video_id: str, transcript_list=None) -> Dict:
         """
         Get information about available transcripts for a video
 
         Args:
             video_id: YouTube video ID
+            transcript_list: Already fetched TranscriptList to reuse (fetched if None)
 
         Returns:
             Dictionary with transcript availability info
         """
         try:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+            if transcript_list is None:
+                transcript_list = self.list_transcripts(video_id)
             
             available_transcripts = {
                 'manual': [],
@@ -200,7 +699,7 @@ class YouTubeTranscriptExtractor:
             print(f"Error getting transcript list: {str(e)}")
             return {'manual': [], 'generated': [], 'translatable': []}
 
-    def extract_transcript_youtube_api(self, video_id: str, languages: List[str] = None, prefer_manual: bool = True) -> Tuple[Optional[List], str, str]:
+    def extract_transcript_youtube_api(self, video_id: str, languages: List[str] = None, prefer_manual: bool = True, transcript_list=None) -> Tuple[Optional[List], str, str]:
         """
         Extract transcript using YouTube Transcript API with comprehensive language support
 
@@ -208,13 +707,16 @@ class YouTubeTranscriptExtractor:
             video_id: YouTube video ID
             languages: List of preferred language codes (e.g., ['en', 'es', 'fr'])
             prefer_manual: Whether to prefer manual transcripts over auto-generated ones
+            transcript_list: Already fetched TranscriptList to reuse (fetched if None)
 
         Returns:
             Tuple of (transcript_data, language_used, transcript_type)
         """
+        api = _transcript_api()
         try:
-            print("Getting available transcripts...")
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+            if transcript_list is None:
+                print("Getting available transcripts...")
+                transcript_list = self.list_transcripts(video_id)
             
             # Get all available transcripts
             manual_transcripts = []
@@ -230,48 +732,7 @@ class YouTubeTranscriptExtractor:
             
             # Define language priority
             if languages is None:
-                # Default language priority - comprehensive list
-                languages = [
-                    'en', 'en-US', 'en-GB', 'en-CA', 'en-AU',  # English variants
-                    'es', 'es-ES', 'es-MX', 'es-AR',           # Spanish variants
-                    'fr', 'fr-FR', 'fr-CA',                    # French variants
-                    'de', 'de-DE', 'de-AT', 'de-CH',          # German variants
-                    'it', 'it-IT',                            # Italian
-                    'pt', 'pt-BR', 'pt-PT',                   # Portuguese variants
-                    'ru', 'ru-RU',                            # Russian
-                    'ja', 'ja-JP',                            # Japanese
-                    'ko', 'ko-KR',                            # Korean
-                    'zh', 'zh-CN', 'zh-TW', 'zh-HK',         # Chinese variants
-                    'hi', 'hi-IN',                            # Hindi
-                    'ar', 'ar-SA',                            # Arabic
-                    'nl', 'nl-NL', 'nl-BE',                   # Dutch
-                    'sv', 'sv-SE',                            # Swedish
-                    'no', 'nb-NO', 'nn-NO',                   # Norwegian
-                    'da', 'da-DK',                            # Danish
-                    'fi', 'fi-FI',                            # Finnish
-                    'pl', 'pl-PL',                            # Polish
-                    'tr', 'tr-TR',                            # Turkish
-                    'he', 'he-IL',                            # Hebrew
-                    'th', 'th-TH',                            # Thai
-                    'vi', 'vi-VN',                            # Vietnamese
-                    'id', 'id-ID',                            # Indonesian
-                    'ms', 'ms-MY',                            # Malay
-                    'tl', 'tl-PH',                            # Filipino
-                    'uk', 'uk-UA',                            # Ukrainian
-                    'cs', 'cs-CZ',                            # Czech
-                    'sk', 'sk-SK',                            # Slovak
-                    'hu', 'hu-HU',                            # Hungarian
-                    'ro', 'ro-RO',                            # Romanian
-                    'bg', 'bg-BG',                            # Bulgarian
-                    'hr', 'hr-HR',                            # Croatian
-                    'sr', 'sr-RS',                            # Serbian
-                    'sl', 'sl-SI',                            # Slovenian
-                    'et', 'et-EE',                            # Estonian
-                    'lv', 'lv-LV',                            # Latvian
-                    'lt', 'lt-LT',                            # Lithuanian
-                    'el', 'el-GR',                            # Greek
-                    'mt', 'mt-MT',                            # Maltese
-                ]
+                languages = _DEFAULT_LANGUAGES
             
             # Try to find transcript in preferred order
             transcript_sources = []
@@ -281,16 +742,22 @@ class YouTubeTranscriptExtractor:
                 transcript_sources = [(generated_transcripts, "Auto-generated"), (manual_transcripts, "Manual")]
             
             for transcript_group, transcript_type in transcript_sources:
+                # The first transcript listed for a language code wins, as when scanning the group
+                by_code = {}
+                for transcript in transcript_group:
+                    by_code.setdefault(transcript.language_code, transcript)
                 for lang_code in languages:
-                    for transcript in transcript_group:
-                        if transcript.language_code == lang_code:
-                            print(f"Found {transcript_type.lower()} transcript in {transcript.language} ({lang_code})")
-                            try:
-                                transcript_data = transcript.fetch()
-                                return transcript_data, transcript.language, transcript_type
-                            except Exception as e:
-                                print(f"Error fetching transcript in {lang_code}: {str(e)}")
-                                continue
+                    transcript = by_code.get(lang_code)
+                    if transcript is None:
+                        continue
+                    print(f"Found {transcript_type.lower()} transcript in {transcript.language} ({lang_code})")
+                    try:
+                        self.rate_limiter.wait()
+                        transcript_data = transcript.fetch()
+                        return transcript_data, transcript.language, transcript_type
+                    except Exception as e:
+                        print(f"Error fetching transcript in {lang_code}: {str(e)}")
+                        continue
             
             # If no exact match found, try any available transcript
             all_transcripts = manual_transcripts + generated_transcripts
@@ -299,6 +766,7 @@ class YouTubeTranscriptExtractor:
                 transcript_type = "Manual" if not transcript.is_generated else "Auto-generated"
                 print(f"Using first available transcript: {transcript_type} in {transcript.language} ({transcript.language_code})")
                 try:
+                    self.rate_limiter.wait()
                     transcript_data = transcript.fetch()
                     return transcript_data, transcript.language, transcript_type
                 except Exception as e:
@@ -312,6 +780,7 @@ class YouTubeTranscriptExtractor:
                         try:
                             print(f"Trying to translate to {lang_code}...")
                             translated = transcript.translate(lang_code)
+                            self.rate_limiter.wait()
                             transcript_data = translated.fetch()
                             return transcript_data, f"{transcript.language} (translated to {lang_code})", f"Translated {transcript_type}"
                         except Exception as e:
@@ -320,13 +789,13 @@ class YouTubeTranscriptExtractor:
             
             return None, "", ""
 
-        except TranscriptsDisabled:
+        except api.TranscriptsDisabled:
             print("Transcripts are disabled for this video")
             return None, "", ""
-        except NoTranscriptFound:
+        except api.NoTranscriptFound:
             print("No transcripts found for this video")
             return None, "", ""
-        except VideoUnavailable:
+        except api.VideoUnavailable:
             print("Video is unavailable")
             return None, "", ""
         except Exception as e:
@@ -340,26 +809,19 @@ class YouTubeTranscriptExtractor:
         if not transcript:
             return ""
 
-        formatted_text = ""
-        for segment in transcript:
-            # Handle both dict and FetchedTranscriptSnippet objects
-            if hasattr(segment, 'start'):
-                start_time = segment.start
-                text = segment.text
-            else:
-                start_time = segment.get('start', 0)
-                text = segment.get('text', '')
-
-            if include_timestamps:
-                # Convert seconds to MM:SS format
-                minutes = int(start_time // 60)
-                seconds = int(start_time % 60)
-                timestamp = f"[{minutes:02d}:{seconds:02d}]"
-                formatted_text += f"{timestamp} {text}\n"
-            else:
-                formatted_text += f"{text} "
+        # Handle both dict and FetchedTranscriptSnippet objects
+        if isinstance(next(iter(transcript)), dict):
+            pairs = [(segment.get('start', 0), segment.get('text', '')) for segment in transcript]
+        else:
+            pairs = [(segment.start, segment.text) for segment in transcript]
 
-        return formatted_text.strip()
+        if include_timestamps:
+            # Convert seconds to MM:SS format
+            return "\n".join([
+                f"[{int(start_time) // 60:02d}:{int(start_time) % 60:02d}] {text}"
+                for start_time, text in pairs
+            ]).strip()
+        return " ".join([text for _, text in pairs]).strip()
 
     def get_plain_text(self, transcript: List) -> str:
         """
@@ -369,28 +831,113 @@ class YouTubeTranscriptExtractor:
             return ""
 
         text_parts = []
+        append = text_parts.append
         for segment in transcript:
             # Handle both dict and FetchedTranscriptSnippet objects
-            if hasattr(segment, 'text'):
-                text_parts.append(segment.text)
+            if isinstance(segment, dict):
+                append(segment.get('text', ''))
             else:
-                text_parts.append(segment.get('text', ''))
+                append(segment.text)
 
         return " ".join(text_parts)
 
-    def save_transcript(self, video_id: str, data: Dict) -> str:
+    def _process_segments(self, transcript, include_timestamps: bool = True) -> Tuple[str, str, List[Dict], int]:
+        """
+        Build the formatted text, plain text and storage form of a transcript in a single pass
+
+        Produces the same output as format_transcript, get_plain_text and the
+        dict conversion combined, but walks the segments only once. The word
+        count is accumulated per segment, which matches len(plain_text.split())
+        because segments are joined with whitespace.
+
+        Returns:
+            Tuple of (formatted_text, plain_text, segments_for_storage, word_count)
+        """
+        word_count = 0
+        formatted_parts = []
+        plain_parts = []
+        storage = []
+        formatted_append = formatted_parts.append
+        plain_append = plain_parts.append
+        storage_append = storage.append
+
+        # All segments share one type: FetchedTranscriptSnippet objects or dicts
+        first = next(iter(transcript), None)
+        if first is None:
+            return "", "", storage, 0
+
+        if isinstance(first, dict):
+            get = dict.get
+            for segment in transcript:
+                start_time = get(segment, 'start', 0)
+                text = get(segment, 'text', '')
+                if include_timestamps:
+                    minutes, seconds = divmod(int(start_time), 60)
+                    formatted_append(f"[{minutes:02d}:{seconds:02d}] {text}")
+                else:
+                    formatted_append(text)
+                plain_append(text)
+                word_count += len(text.split())
+                # Already a dict
+                storage_append(segment)
+        else:
+            for segment in transcript:
+                start_time = segment.start
+                text = segment.text
+                if include_timestamps:
+                    minutes, seconds = divmod(int(start_time), 60)
+                    formatted_append(f"[{minutes:02d}:{seconds:02d}] {text}")
+                else:
+                    formatted_append(text)
+                plain_append(text)
+                word_count += len(text.split())
+                storage_append({
+                    'start': start_time,
+                    'duration': getattr(segment, 'duration', 0),
+                    'text': text
+                })
+
+        separator = "\n" if include_timestamps else " "
+        return separator.join(formatted_parts).strip(), " ".join(plain_parts), storage, word_count
+
+    def save_transcript(self, video_id: str, data: Dict, compact: bool = False, compress: Optional[bool] = None,
+                        timestamp: Optional[datetime] = None) -> str:
         """
         Save transcript data to JSON file
+
+        Args:
+            video_id: YouTube video ID
+            data: Transcript data to store
+            compact: Skip pretty-printing for smaller, faster writes in batch runs
+            compress: Write gzip-compressed .json.gz (defaults to compress_output)
+            timestamp: Time used in the filename (defaults to now)
         """
-        filename = f"{video_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        if compress is None:
+            compress = self.compress_output
+
+        if not self.store_text_fields:
+            # Both text forms are derived from transcript_raw and roughly double the file size
+            data = {key: value for key, value in data.items() if key not in ('transcript_formatted', 'transcript_plain')}
+
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        filename = f"{video_id}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         filepath = os.path.join(self.storage_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if compress:
+            # Segment keys and caption text repeat heavily, so this is typically 5-10x smaller
+            filepath += '.gz'
+            with gzip.open(filepath, 'wb', compresslevel=6) as f:
+                f.write(dumps_json(data, indent=not compact))
+        else:
+            write_json(filepath, data, indent=not compact)
 
         return filepath
 
-    def extract_and_save(self, youtube_url: str, languages: List[str] = None, prefer_manual: bool = True, include_timestamps: bool = True) -> Tuple[bool, str, Dict]:
+    def extract_and_save(self, youtube_url: str, languages: List[str] = None, prefer_manual: bool = True, include_timestamps: bool = True,
+                         force_refresh: bool = False, save_to_disk: bool = True,
+                         progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, str, Dict]:
         """
         Main method to extract and save transcript using YouTube Transcript API
 
@@ -399,55 +946,81 @@ class YouTubeTranscriptExtractor:
             languages: List of preferred language codes
             prefer_manual: Whether to prefer manual transcripts over auto-generated ones
             include_timestamps: Whether to include timestamps in formatted output
+            force_refresh: Ignore cached metadata, listings and transcripts and fetch everything again
+            save_to_disk: Write the transcript JSON file; callers that only use the returned data can skip it
+            progress_callback: Called with a short description as each extraction stage starts,
+                so UIs can show progress while the transcript downloads
 
         Returns:
             Tuple of (success, message, data)
         """
+        def report(stage: str) -> None:
+            if progress_callback is not None:
+                progress_callback(stage)
+
         # Extract video ID
         video_id = self.extract_video_id(youtube_url)
         if not video_id:
             return False, "Invalid YouTube URL", {}
 
+        # Reuse a recent extraction of the same video with the same options
+        cache_path = self._cache_path(video_id, languages, prefer_manual, include_timestamps)
+        cached = None if force_refresh else self._load_cached(cache_path)
+        if cached is not None:
+            print(f"Using cached transcript for video: {video_id}")
+            return True, self.success_message(cached, f"Loaded from cache: {cache_path}"), cached
+
         print(f"Extracting transcript for video: {video_id}")
 
-        # Get video metadata
-        print("Getting video metadata...")
-        metadata = self.get_video_info_from_page(video_id)
+        # Fetch the video metadata in the background while the transcripts are
+        # listed; the two requests are independent, so their latencies overlap
+        print("Getting video metadata and available transcripts...")
+        report("Getting video metadata and available transcripts...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metadata_future = executor.submit(self.get_video_info, video_id, force_refresh)
 
-        # Get available transcripts info
-        available_transcripts = self.get_available_transcripts(video_id)
+            # List transcripts once; both the availability info and the
+            # extraction below work from the same TranscriptList
+            try:
+                transcript_list = self.list_transcripts(video_id, force_refresh)
+            except Exception as e:
+                print(f"Error getting transcript list: {str(e)}")
+                transcript_list = None
+
+            # get_video_info handles its own errors and never raises
+            metadata = metadata_future.result()
+
+        if transcript_list is not None:
+            # Get available transcripts info
+            available_transcripts = self.get_available_transcripts(video_id, transcript_list)
+
+            # Extract transcript using YouTube Transcript API
+            print("\nExtracting transcript using YouTube Transcript API...")
+            report("Downloading transcript...")
+            transcript, language_used, transcript_type = self.extract_transcript_youtube_api(
+                video_id, languages, prefer_manual, transcript_list
+            )
+        else:
+            available_transcripts = {'manual': [], 'generated': [], 'translatable': []}
+            transcript, language_used, transcript_type = None, "", ""
+
+        if not transcript:
+            return False, _EXTRACTION_FAILED_MSG, {}
 
-        # Extract transcript using YouTube Transcript API
-        print("\nExtracting transcript using YouTube Transcript API...")
-        transcript, language_used, transcript_type = self.extract_transcript_youtube_api(
-            video_id, languages, prefer_manual
+        # Format transcript and convert it to a serializable format in one pass
+        report(f"Processing {len(transcript)} caption segments...")
+        formatted_transcript, plain_text, transcript_for_storage, word_count = self._process_segments(
+            transcript, include_timestamps
         )
 
-        if not transcript:
-            error_msg = "Could not extract transcript. Possible reasons:\n"
-            error_msg += "- Video has no captions/subtitles available\n"
-            error_msg += "- Video is private or restricted\n"
-            error_msg += "- Transcripts are disabled for this video\n"
-            error_msg += "- Video is unavailable"
-            return False, error_msg, {}
-
-        # Format transcript
-        formatted_transcript = self.format_transcript(transcript, include_timestamps)
-        plain_text = self.get_plain_text(transcript)
-
-        # Convert transcript to serializable format for storage
-        transcript_for_storage = []
-        for segment in transcript:
-            if hasattr(segment, 'start'):
-                # FetchedTranscriptSnippet object
-                transcript_for_storage.append({
-                    'start': segment.start,
-                    'duration': getattr(segment, 'duration', 0),
-                    'text': segment.text
-                })
-            else:
-                # Already a dict
-                transcript_for_storage.append(segment)
+        # oEmbed (or a failed page fetch) gives no duration; the end of the
+        # last caption is a close estimate
+        if not metadata.get('duration') and transcript_for_storage:
+            last = transcript_for_storage[-1]
+            metadata['duration'] = int(last.get('start', 0) + last.get('duration', 0))
+
+        # One clock read for both extracted_at and the saved file's name
+        extracted_at = datetime.now()
 
         # Prepare data for storage
         data = {
@@ -462,25 +1035,132 @@ class YouTubeTranscriptExtractor:
             'transcript_raw': transcript_for_storage,
             'transcript_formatted': formatted_transcript,
             'transcript_plain': plain_text,
-            'extracted_at': datetime.now().isoformat(),
-            'word_count': len(plain_text.split()),
+            'extracted_at': extracted_at.isoformat(),
+            'word_count': word_count,
             'duration_minutes': round(metadata.get('duration', 0) / 60, 2),
             'segment_count': len(transcript_for_storage)
         }
 
         # Save to file
-        filepath = self.save_transcript(video_id, data)
+        if save_to_disk:
+            report("Saving transcript...")
+            filepath = self.save_transcript(video_id, data, timestamp=extracted_at)
+            location = f"Saved to: {filepath}"
+        else:
+            location = "Not saved to disk"
+        self._store_cached(cache_path, data)
+
+        return True, self.success_message(data, location), data
+
+    def success_message(self, data: Dict, location: str) -> str:
+        """Summarize an extraction result for display, ending with where it was stored"""
+        return "\n".join([
+            "Transcript extracted successfully!",
+            f"Title: {data['metadata'].get('title', 'Unknown')}",
+            f"Duration: {data['duration_minutes']} minutes",
+            f"Language: {data['transcript_info']['language']}",
+            f"Type: {data['transcript_info']['type']}",
+            f"Segments: {data['segment_count']}",
+            f"Word Count: {data['word_count']}",
+            location,
+        ])
+
+    def _cache_path(self, video_id: str, languages: Optional[List[str]], prefer_manual: bool, include_timestamps: bool) -> str:
+        """
+        Path of the cached extraction for a video and set of extraction options
+
+        Cache entries live in a hidden subdirectory so they never show up when
+        the storage directory is scanned for transcript JSON files.
+        """
+        options = repr((tuple(languages) if languages else None, prefer_manual, include_timestamps))
+        digest = hashlib.sha1(options.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.storage_dir, '.cache', f"{video_id}_{digest}.json.gz")
+
+    def _load_cached(self, cache_path: str, ttl: Optional[float] = None) -> Optional[Dict]:
+        """Return the cached entry if it exists and is younger than ttl (defaults to cache_ttl)"""
+        if not self.cache_ttl:
+            return None
+        if ttl is None:
+            ttl = self.cache_ttl
+        try:
+            if time.time() - os.path.getmtime(cache_path) >= ttl:
+                return None
+            with gzip.open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+            return None
+
+    def _store_cached(self, cache_path: str, data: Dict) -> None:
+        """Atomically write an entry to the cache (gzip-compressed compact JSON)"""
+        if not self.cache_ttl:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Unique per thread so parallel extract_many workers never share a temp file
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(dumps_json(data, indent=False))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Could not write cache entry {cache_path}: {str(e)}")
+
+    def extract_many(self, youtube_urls: List[str], max_workers: int = 8, **kwargs) -> List[Tuple[bool, str, Dict]]:
+        """
+        Extract several videos in parallel worker threads
+
+        The pipeline is dominated by network waits, which release the GIL, so
+        a small thread pool overlaps them. Workers beyond _HTTP_POOL_SIZE would
+        open throwaway connections, so max_workers is capped at that size.
+
+        Args:
+            youtube_urls: YouTube video URLs
+            max_workers: Number of videos processed at the same time
+            **kwargs: Passed through to extract_and_save
+
+        Returns:
+            List of (success, message, data) tuples in the order of youtube_urls
+        """
+        extract = functools.partial(self.extract_and_save, **kwargs)
+        with ThreadPoolExecutor(max_workers=min(max_workers, _HTTP_POOL_SIZE)) as executor:
+            return list(executor.map(extract, youtube_urls))
+
+    async def extract_and_save_async(self, youtube_url: str, languages: List[str] = None, prefer_manual: bool = True, include_timestamps: bool = True,
+                                     force_refresh: bool = False, save_to_disk: bool = True) -> Tuple[bool, str, Dict]:
+        """
+        Awaitable version of extract_and_save
+
+        The transcript API and the page fetch are blocking, so the work runs in
+        the event loop's default executor and other extractions can proceed
+        while this one waits on the network.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.extract_and_save, youtube_url, languages, prefer_manual, include_timestamps, force_refresh, save_to_disk)
+        )
+
+    async def extract_many_async(self, youtube_urls: List[str], max_concurrency: int = 8, **kwargs) -> List[Tuple[bool, str, Dict]]:
+        """
+        Extract several videos concurrently
+
+        Args:
+            youtube_urls: YouTube video URLs
+            max_concurrency: Maximum number of videos processed at the same time
+            **kwargs: Passed through to extract_and_save
 
-        success_msg = f"Transcript extracted successfully!\n"
-        success_msg += f"Title: {metadata.get('title', 'Unknown')}\n"
-        success_msg += f"Duration: {data['duration_minutes']} minutes\n"
-        success_msg += f"Language: {language_used}\n"
-        success_msg += f"Type: {transcript_type}\n"
-        success_msg += f"Segments: {data['segment_count']}\n"
-        success_msg += f"Word Count: {data['word_count']}\n"
-        success_msg += f"Saved to: {filepath}"
+        Returns:
+            List of (success, message, data) tuples in the order of youtube_urls
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_one(url):
+            async with semaphore:
+                return await self.extract_and_save_async(url, **kwargs)
 
-        return True, success_msg, data
+        return await asyncio.gather(*(extract_one(url) for url in youtube_urls))
 
 def test_with_sample_videos():
     """
@@ -498,19 +1178,24 @@ def test_with_sample_videos():
     print("Testing YouTube Transcript Extractor with sample videos...")
     print("=" * 60)
 
-    for i, url in enumerate(test_urls, 1):
-        print(f"\nTest {i}: {url}")
-        print("-" * 40)
+    # Report each video as soon as it finishes instead of waiting for the slowest
+    with ThreadPoolExecutor(max_workers=min(8, len(test_urls))) as executor:
+        futures = {executor.submit(extractor.extract_and_save, url): (i, url) for i, url in enumerate(test_urls, 1)}
+        for future in as_completed(futures):
+            i, url = futures[future]
+            success, message, data = future.result()
 
-        success, message, data = extractor.extract_and_save(url)
-        print(message)
+            print(f"\nTest {i}: {url}")
+            print("-" * 40)
 
-        if success:
-            # Show first 200 characters of transcript
-            preview = data['transcript_plain'][:200] + "..." if len(data['transcript_plain']) > 200 else data['transcript_plain']
-            print(f"\nPreview: {preview}")
+            print(message)
 
-        print("\n" + "=" * 60)
+            if success:
+                # Show first 200 characters of transcript
+                preview = data['transcript_plain'][:200] + "..." if len(data['transcript_plain']) > 200 else data['transcript_plain']
+                print(f"\nPreview: {preview}")
+
+            print("\n" + "=" * 60)
 
 def main():
     """
@@ -528,10 +1213,11 @@ def main():
         print("\nOptions:")
         print("1. Extract transcript from URL")
         print("2. Extract with language preference")
-        print("3. Test with sample videos")
-        print("4. Quit")
+        print("3. Extract transcripts from multiple URLs")
+        print("4. Test with sample videos")
+        print("5. Quit")
 
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = input("\nEnter your choice (1-5): ").strip()
 
         if choice == '1':
             youtube_url = input("\nEnter YouTube URL: ").strip()
@@ -578,14 +1264,30 @@ def main():
                 print(f"\nTranscript Preview:\n{'-' * 20}\n{preview}\n{'-' * 20}")
 
         elif choice == '3':
-            test_with_sample_videos()
+            urls_input = input("\nEnter YouTube URLs (comma or space separated): ").strip()
+            youtube_urls = urls_input.replace(',', ' ').split()
+            if not youtube_urls:
+                print("Please enter at least one URL")
+                continue
+
+            print(f"\nProcessing {len(youtube_urls)} videos concurrently...")
+            results = asyncio.run(extractor.extract_many_async(youtube_urls))
+
+            succeeded = 0
+            for url, (success, message, data) in zip(youtube_urls, results):
+                print(f"\n{url}\n{'-' * 40}\n{message}")
+                succeeded += success
+            print(f"\n{succeeded}/{len(youtube_urls)} transcripts extracted")
 
         elif choice == '4':
+            test_with_sample_videos()
+
+        elif choice == '5':
             print("Goodbye!")
             break
 
         else:
-            print("Invalid choice. Please enter 1, 2, 3, or 4.")
+            print("Invalid choice. Please enter 1, 2, 3, 4, or 5.")
 
 if __name__ == "__main__":
     main()
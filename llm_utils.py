@@ -0,0 +1,196 @@
+import os
+import re
+import time
+import random
+import functools
+import threading
+from collections import deque
+from typing import Callable, Optional, TypeVar
+
+# Transient failures that raise without an HTTP status (connection resets,
+# timeouts) are only recognised when the SDK defining them is installed
+_TRANSIENT_ERRORS = ()
+try:
+    import groq
+    _TRANSIENT_ERRORS += (groq.APIConnectionError,)
+except ImportError:
+    pass
+try:
+    from google.api_core import exceptions as google_exceptions
+    _TRANSIENT_ERRORS += (google_exceptions.DeadlineExceeded, google_exceptions.ServiceUnavailable)
+except ImportError:
+    pass
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+MAX_RETRY_AFTER = 30.0
+
+# Free-tier (requests, tokens) per minute; paid accounts can raise them with
+# e.g. GROQ_REQUESTS_PER_MINUTE / GROQ_TOKENS_PER_MINUTE
+PROVIDER_RATE_LIMITS = {
+    'groq': (30, 12000),
+    'gemini': (15, 1000000),
+}
+
+# Transcript tokens sent in one request before it is cut down (summary map
+# step, Q&A retrieval); Groq's is kept inside its per-minute token limit
+MAX_INPUT_TOKENS = {
+    'groq': 6000,
+    'gemini': 100000,  # well inside the context window
+}
+
+# CJK, kana and Hangul characters usually cost a token each, not a quarter of one
+_WIDE_CHAR_RE = re.compile(r'[\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')
+
+T = TypeVar("T")
+
+@functools.lru_cache(maxsize=None)
+def get_http_client():
+    """
+    Process-wide pooled httpx client for the LLM SDKs (pass as http_client=)
+
+    Sharing it lets Q&A and summary calls reuse warm TLS connections instead
+    of reconnecting after the SDK default idle timeout.
+    """
+    import httpx
+
+    return httpx.Client(
+        http2=HTTP2_ENABLED,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=300.0),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+class RateLimiter:
+    """
+    Sliding-window limit on the requests and tokens sent to one provider
+
+    Concurrent callers (batch summaries, the map step, parallel questions)
+    block in acquire() until the last minute's usage leaves room, instead of
+    all firing at once and retrying on 429s.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None, window: float = 60.0):
+        """
+        Initialize the limiter
+
+        Args:
+            requests_per_minute: Requests allowed per window
+            tokens_per_minute: Estimated tokens allowed per window (None for no token limit)
+            window: Window length in seconds
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._sent = deque()  # (sent_at, tokens), oldest first
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request of about tokens tokens fits in the window, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and self._sent[0][0] <= now - self.window:
+                    self._tokens_in_window -= self._sent.popleft()[1]
+
+                # A request larger than the whole token budget goes out once the window is empty
+                fits_tokens = (self.tokens_per_minute is None or not self._sent
+                               or self._tokens_in_window + tokens <= self.tokens_per_minute)
+                if len(self._sent) < self.requests_per_minute and fits_tokens:
+                    self._sent.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+                wait = self._sent[0][0] + self.window - now
+            time.sleep(max(wait, 0.05))
+
+@functools.lru_cache(maxsize=None)
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Process-wide RateLimiter for provider ('groq' or 'gemini'), shared by Q&A and summaries"""
+    requests, tokens = PROVIDER_RATE_LIMITS[provider]
+    prefix = provider.upper()
+    return RateLimiter(int(os.getenv(f'{prefix}_REQUESTS_PER_MINUTE', requests)),
+                       int(os.getenv(f'{prefix}_TOKENS_PER_MINUTE', tokens)))
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count of text, for rate limits and prompt budgets
+
+    About four characters per token for alphabetic scripts and one per CJK
+    character, so e.g. a Japanese transcript is not mistaken for a quarter
+    of its real size.
+    """
+    if text.isascii():
+        return len(text) // 4 + 1
+    wide = len(_WIDE_CHAR_RE.findall(text))
+    return (len(text) - wide) // 4 + wide + 1
+
+def estimate_prompt_tokens(prompt: list) -> int:
+    """estimate_tokens for chat messages (dicts with 'content') or a list of Gemini content strings"""
+    return sum(estimate_tokens(part['content'] if isinstance(part, dict) else part) for part in prompt)
+
+def _status_code(exc: Exception) -> Optional[int]:
+    # groq.APIStatusError has status_code; google.api_core errors carry the HTTP status as code
+    for attr in ('status_code', 'code'):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+def is_transient_error(exc: Exception) -> bool:
+    """Whether exc is a rate limit, server error or dropped connection worth retrying"""
+    return _status_code(exc) in RETRYABLE_STATUS_CODES or isinstance(exc, _TRANSIENT_ERRORS)
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait, from the Retry-After header if present"""
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return min(float(headers.get('retry-after')), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+def call_with_retry(fn: Callable[..., T], *args, attempts: int = 4, base_delay: float = 0.5,
+                    max_delay: float = 8.0, rate_limiter: Optional[RateLimiter] = None,
+                    tokens: int = 0, **kwargs) -> T:
+    """
+    Call an LLM API function, retrying transient failures
+
+    Waits use exponential backoff with full jitter, so clients that hit a rate
+    limit together do not retry in lockstep. A Retry-After header on the error
+    takes precedence over the computed wait. Other errors are raised at once.
+
+    Args:
+        fn: API call to make
+        *args: Positional arguments for fn
+        attempts: Total number of calls before giving up
+        base_delay: Backoff ceiling for the first retry in seconds
+        max_delay: Upper bound for the backoff ceiling in seconds
+        rate_limiter: Limiter to wait on before every attempt, retries included
+        tokens: Estimated prompt tokens plus the max_tokens allowed for the response,
+            counted against rate_limiter on every attempt
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(attempts):
+        if rate_limiter is not None:
+            rate_limiter.acquire(tokens)
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient_error(e):
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            print(f"Transient API error ({e}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
@@ -1,67 +1,132 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from groq import Groq
 import google.generativeai as genai
-from typing import Optional
+from typing import Callable, Iterator, List, Optional
+
+from llm_utils import (HTTP2_ENABLED, MAX_INPUT_TOKENS, call_with_retry, estimate_prompt_tokens, get_http_client,
+                       get_rate_limiter)
+from qna_cache import LLMCache
+from qna_retrieval import TOP_K_CHUNKS, select_context
+from summarize_json import read_transcript_json
 
 # Read API keys securely from environment variables
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 
+GROQ_MODEL = "llama-3.3-70b-versatile"
+GEMINI_MODEL = "gemini-1.5-flash"
+TEMPERATURE = 0.7
+MAX_TOKENS = 1024
+
+# Built once; the SDK validates and converts these on construction
+GEMINI_GENERATION_CONFIG = genai.types.GenerationConfig(temperature=TEMPERATURE, max_output_tokens=MAX_TOKENS)
+GEMINI_TEST_CONFIG = genai.types.GenerationConfig(temperature=0.1, max_output_tokens=10)
+
+# Identical (model, transcript, question) requests are answered from here. A
+# video's transcript does not change, so answers stay valid for a week and
+# repeat questions about popular videos cost no tokens across restarts.
+# QNA_CACHE_DIR moves the entries out of the working directory
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+RESPONSE_CACHE_DIR = os.environ.get("QNA_CACHE_DIR", ".llm_cache")
+response_cache = LLMCache(RESPONSE_CACHE_DIR, ttl=RESPONSE_CACHE_TTL)
+
+# The transcript goes first and the question last so every question about the
+# same transcript shares an identical prompt prefix, which Groq and Gemini
+# can serve from their prompt caches instead of reprocessing it. Long
+# transcripts are cut down to the chunks relevant to each question instead
+# (see qna_retrieval.select_context): only those over the provider's
+# MAX_INPUT_TOKENS, so most videos keep the identical prefix
+TRANSCRIPT_PROMPT_HEAD = """Answer questions based on the transcript below. If the information isn't directly available in the transcript,
+you can use your general knowledge but please indicate that you're doing so by starting with "Based on general knowledge:"
+
+Here's a transcript:
+---
+"""
+TRANSCRIPT_PROMPT_TAIL = "\n---"
+
+# Both providers are asked at once in fallback mode; a slow or failing one
+# no longer delays the answer from the other
+_provider_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="qna")
+
 # Initialize clients (fail gracefully if keys are missing)
 groq_client = None
 gemini_model = None
 
 if GROQ_API_KEY:
-    groq_client = Groq(api_key=GROQ_API_KEY)  # Do not expose key in source!
+    # Retries are done by call_with_retry (jittered, honours Retry-After) rather than the SDK
+    groq_client = Groq(api_key=GROQ_API_KEY, http_client=get_http_client(), max_retries=0)  # Do not expose key in source!
 else:
     print("Warning: GROQ_API_KEY not set in environment.")
 
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
-    gemini_model = genai.GenerativeModel('gemini-1.5-flash')
+    gemini_model = genai.GenerativeModel(GEMINI_MODEL)
 else:
     print("Warning: GEMINI_API_KEY not set in environment.")
 
 def read_transcript(file_path: str) -> str:
-    """Read the transcript file content."""
+    """Read the transcript file content (plain text, or a .json/.json.gz file from extract_transcript.py)."""
     try:
+        if file_path.lower().endswith(('.json', '.json.gz')):
+            data = read_transcript_json(file_path)
+            return data.get('transcript_plain') or ' '.join(segment.get('text', '') for segment in data.get('transcript_raw', []))
+
         with open(file_path, 'r', encoding='utf-8') as file:
             return file.read()
     except Exception as e:
         print(f"Error reading file: {e}")
         return ""
 
+def _transcript_prompt(transcript: str, question: str, provider: str, top_k: int = TOP_K_CHUNKS) -> str:
+    # Plain concatenation around the constant parts; the transcript is copied
+    # once instead of going through str.format's template parsing
+    context = select_context(transcript, question, top_k, max_tokens=MAX_INPUT_TOKENS[provider])
+    return "".join((TRANSCRIPT_PROMPT_HEAD, context, TRANSCRIPT_PROMPT_TAIL))
+
+def _groq_messages(transcript: str, question: str) -> list:
+    return [
+        {
+            "role": "system",
+            "content": _transcript_prompt(transcript, question, 'groq'),
+        },
+        {
+            "role": "user",
+            "content": question,
+        }
+    ]
+
+def _gemini_contents(transcript: str, question: str) -> list:
+    return [_transcript_prompt(transcript, question, 'gemini'), f"Question: {question}"]
+
 def ask_groq(transcript: str, question: str) -> Optional[str]:
     """Ask a question using Groq API."""
     if not groq_client:
         print("Groq client not initialized. Please set GROQ_API_KEY.")
         return None
+
+    cache_key = response_cache.cache_key(GROQ_MODEL, transcript, question, TEMPERATURE, MAX_TOKENS)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        prompt = f"""
-        Here's a transcript:
-        ---
-        {transcript}
-        ---
-
-        Question: {question}
-
-        Please answer the question based on the transcript. If the information isn't directly available in the transcript,
-        you can use your general knowledge but please indicate that you're doing so by starting with "Based on general knowledge:"
-        """
-
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            max_tokens=1024,
+        messages = _groq_messages(transcript, question)
+        chat_completion = call_with_retry(
+            groq_client.chat.completions.create,
+            rate_limiter=get_rate_limiter('groq'),
+            tokens=estimate_prompt_tokens(messages) + MAX_TOKENS,
+            messages=messages,
+            model=GROQ_MODEL,
+            temperature=TEMPERATURE,
+            max_tokens=MAX_TOKENS,
         )
 
-        return chat_completion.choices[0].message.content
+        answer = chat_completion.choices[0].message.content
+        if answer:
+            response_cache.set(cache_key, answer)
+        return answer
 
     except Exception as e:
         print(f"Groq API error: {e}")
@@ -72,93 +137,323 @@ def ask_gemini(transcript: str, question: str) -> Optional[str]:
     if not gemini_model:
         print("Gemini model not initialized. Please set GEMINI_API_KEY.")
         return None
+
+    cache_key = response_cache.cache_key(GEMINI_MODEL, transcript, question, TEMPERATURE, MAX_TOKENS)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        prompt = f"""
-        Here's a transcript:
-        ---
-        {transcript}
-        ---
-
-        Question: {question}
-
-        Please answer the question based on the transcript. If the information isn't directly available in the transcript,
-        you can use your general knowledge but please indicate that you're doing so by starting with "Based on general knowledge:"
-        """
-
-        response = gemini_model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.7,
-                max_output_tokens=1024,
-            )
+        contents = _gemini_contents(transcript, question)
+        response = call_with_retry(
+            gemini_model.generate_content,
+            contents,
+            rate_limiter=get_rate_limiter('gemini'),
+            tokens=estimate_prompt_tokens(contents) + MAX_TOKENS,
+            generation_config=GEMINI_GENERATION_CONFIG
         )
 
-        return response.text
+        answer = response.text
+        if answer:
+            response_cache.set(cache_key, answer)
+        return answer
 
     except Exception as e:
         print(f"Gemini API error: {e}")
         return None
 
-def ask_question_with_fallback(transcript: str, question: str) -> Optional[str]:
-    """Ask a question with Gemini as primary and Groq as fallback."""
-    print("🔄 Trying Gemini API...")
-    
-    answer = ask_gemini(transcript, question)
+def ask_groq_stream(transcript: str, question: str) -> Iterator[str]:
+    """Stream an answer from Groq API as it is generated."""
+    if not groq_client:
+        print("Groq client not initialized. Please set GROQ_API_KEY.")
+        return
+
+    cache_key = response_cache.cache_key(GROQ_MODEL, transcript, question, TEMPERATURE, MAX_TOKENS)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    try:
+        messages = _groq_messages(transcript, question)
+        stream = call_with_retry(
+            groq_client.chat.completions.create,
+            rate_limiter=get_rate_limiter('groq'),
+            tokens=estimate_prompt_tokens(messages) + MAX_TOKENS,
+            messages=messages,
+            model=GROQ_MODEL,
+            temperature=TEMPERATURE,
+            max_tokens=MAX_TOKENS,
+            stream=True,
+        )
+        for chunk in stream:
+            text = chunk.choices[0].delta.content
+            if text:
+                parts.append(text)
+                yield text
+
+    except Exception as e:
+        print(f"Groq API error: {e}")
+        return
+
+    answer = "".join(parts)
     if answer:
-        print("✅ Response from Gemini")
-        return answer
-    
-    print("⚠️  Gemini failed, trying Groq API as fallback...")
-    answer = ask_groq(transcript, question)
+        response_cache.set(cache_key, answer)
+
+def ask_gemini_stream(transcript: str, question: str) -> Iterator[str]:
+    """Stream an answer from Gemini API as it is generated."""
+    if not gemini_model:
+        print("Gemini model not initialized. Please set GEMINI_API_KEY.")
+        return
+
+    cache_key = response_cache.cache_key(GEMINI_MODEL, transcript, question, TEMPERATURE, MAX_TOKENS)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    try:
+        contents = _gemini_contents(transcript, question)
+        response = call_with_retry(
+            gemini_model.generate_content,
+            contents,
+            rate_limiter=get_rate_limiter('gemini'),
+            tokens=estimate_prompt_tokens(contents) + MAX_TOKENS,
+            generation_config=GEMINI_GENERATION_CONFIG,
+            stream=True,
+        )
+        for chunk in response:
+            text = chunk.text
+            if text:
+                parts.append(text)
+                yield text
+
+    except Exception as e:
+        print(f"Gemini API error: {e}")
+        return
+
+    answer = "".join(parts)
     if answer:
-        print("✅ Response from Groq (fallback)")
-        return answer
-    
+        response_cache.set(cache_key, answer)
+
+def ask_question_with_fallback(transcript: str, question: str) -> Optional[str]:
+    """Ask Gemini and Groq concurrently and return the first successful answer."""
+    print("🔄 Asking Gemini and Groq...")
+
+    futures = {
+        _provider_pool.submit(ask_gemini, transcript, question): "Gemini",
+        _provider_pool.submit(ask_groq, transcript, question): "Groq",
+    }
+    for future in as_completed(futures):
+        answer = future.result()
+        if answer:
+            print(f"✅ Response from {futures[future]}")
+            # The slower request cannot be interrupted mid-flight; its answer
+            # still lands in the response cache when it finishes
+            for other in futures:
+                other.cancel()
+            return answer
+
     print("❌ Both APIs failed")
     return None
 
-def test_apis():
-    """Test both APIs to ensure they're working."""
-    print("Testing API connections...")
-    
+def ask_question_stream(transcript: str, question: str) -> Iterator[str]:
+    """Stream the answer from whichever of Gemini and Groq starts responding first."""
+    print("🔄 Asking Gemini and Groq...")
+
+    streams = {
+        "Gemini": ask_gemini_stream(transcript, question),
+        "Groq": ask_groq_stream(transcript, question),
+    }
+    futures = {_provider_pool.submit(next, stream, None): name for name, stream in streams.items()}
+
+    winner = None
+    for future in as_completed(futures):
+        name = futures[future]
+        first_chunk = future.result()
+        if first_chunk and winner is None:
+            winner = name
+            break
+        streams[name].close()
+
+    if winner is None:
+        print("❌ Both APIs failed")
+        return
+
+    print(f"✅ Streaming response from {winner}")
+    # Closing the losing stream as soon as it produces its first chunk
+    # drops its connection instead of letting it generate a full answer
+    for future, name in futures.items():
+        if name != winner:
+            future.add_done_callback(lambda _, stream=streams[name]: stream.close())
+
+    yield first_chunk
+    yield from streams[winner]
+
+def ask_questions(transcript: str, questions: List[str],
+                  ask: Callable[[str, str], Optional[str]] = ask_question_with_fallback,
+                  max_workers: int = 5) -> List[Optional[str]]:
+    """
+    Answer several questions about one transcript concurrently
+
+    Args:
+        transcript: Transcript text used as context
+        questions: Questions to ask
+        ask: Function used for each question (e.g. ask_gemini for Gemini only)
+        max_workers: Requests in flight at once, keeps bursts under provider rate limits
+
+    Returns:
+        Answers in the same order as questions (None where a question failed)
+    """
+    if not questions:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(questions))) as executor:
+        return list(executor.map(lambda question: ask(transcript, question), questions))
+
+# Matches the "A1:" style labels that start each answer in a batch response
+_BATCH_ANSWER_RE = re.compile(r'^[ \t*#]*A(\d+)[ \t*]*[:.)][ \t*]*', re.MULTILINE)
+
+def ask_groq_batch(transcript: str, questions: List[str]) -> List[Optional[str]]:
+    """
+    Answer several questions with a single Groq request
+
+    The transcript is sent once for all questions instead of once per
+    question. Cached answers are reused and only the remaining questions are
+    sent; every parsed answer is cached individually.
+
+    Args:
+        transcript: Transcript text used as context
+        questions: Questions to ask
+
+    Returns:
+        Answers in the same order as questions (None where no answer could be parsed)
+    """
+    answers: List[Optional[str]] = [None] * len(questions)
+    cache_keys = [response_cache.cache_key(GROQ_MODEL, transcript, q, TEMPERATURE, MAX_TOKENS) for q in questions]
+    pending = []
+    for i, key in enumerate(cache_keys):
+        answers[i] = response_cache.get(key)
+        if answers[i] is None:
+            pending.append(i)
+
+    if not pending:
+        return answers
+    if not groq_client:
+        print("Groq client not initialized. Please set GROQ_API_KEY.")
+        return answers
+
+    numbered = "\n".join(f"Q{n}: {questions[i]}" for n, i in enumerate(pending, 1))
+    request = (
+        "Answer each of the following questions separately. Start each answer on "
+        "a new line with its label (A1:, A2:, ...).\n\n" + numbered
+    )
+    messages = [
+        {
+            "role": "system",
+            "content": _transcript_prompt(transcript, numbered, 'groq', top_k=TOP_K_CHUNKS * len(pending)),
+        },
+        {
+            "role": "user",
+            "content": request,
+        }
+    ]
+    max_tokens = min(MAX_TOKENS * len(pending), 8192)
+    try:
+        chat_completion = call_with_retry(
+            groq_client.chat.completions.create,
+            rate_limiter=get_rate_limiter('groq'),
+            tokens=estimate_prompt_tokens(messages) + max_tokens,
+            messages=messages,
+            model=GROQ_MODEL,
+            temperature=TEMPERATURE,
+            max_tokens=max_tokens,
+        )
+        content = chat_completion.choices[0].message.content or ""
+    except Exception as e:
+        print(f"Groq API error: {e}")
+        return answers
+
+    # re.split with one group gives [preamble, label, answer, label, answer, ...]
+    parts = _BATCH_ANSWER_RE.split(content)
+    for label, answer in zip(parts[1::2], parts[2::2]):
+        n = int(label)
+        answer = answer.strip()
+        if 1 <= n <= len(pending) and answer:
+            i = pending[n - 1]
+            answers[i] = answer
+            response_cache.set(cache_keys[i], answer)
+
+    return answers
+
+def _check_gemini() -> str:
     try:
         if gemini_model:
-            test_response = gemini_model.generate_content("Hello, can you respond with just 'Gemini working'?")
-            print("✅ Gemini API: Connected")
-        else:
-            print("❌ Gemini API: Not initialized")
+            gemini_model.generate_content(
+                "Hello, can you respond with just 'Gemini working'?",
+                generation_config=GEMINI_TEST_CONFIG,
+            )
+            return "✅ Gemini API: Connected"
+        return "❌ Gemini API: Not initialized"
     except Exception as e:
-        print(f"❌ Gemini API: Failed - {e}")
-    
+        return f"❌ Gemini API: Failed - {e}"
+
+def _check_groq() -> str:
     try:
         if groq_client:
-            test_response = groq_client.chat.completions.create(
+            groq_client.chat.completions.create(
                 messages=[{"role": "user", "content": "Hello, can you respond with just 'Groq working'?"}],
-                model="llama-3.3-70b-versatile",
+                model=GROQ_MODEL,
                 temperature=0.1,
                 max_tokens=10,
             )
-            print("✅ Groq API: Connected")
-        else:
-            print("❌ Groq API: Not initialized")
+            return "✅ Groq API: Connected"
+        return "❌ Groq API: Not initialized"
     except Exception as e:
-        print(f"❌ Groq API: Failed - {e}")
-    
+        return f"❌ Groq API: Failed - {e}"
+
+def check_apis() -> List[str]:
+    """Ping both APIs concurrently and return one status line per API."""
+    checks = [_provider_pool.submit(_check_gemini), _provider_pool.submit(_check_groq)]
+    return [check.result() for check in checks]
+
+def print_api_status(status_lines: List[str]) -> None:
+    print("Testing API connections...")
+    for line in status_lines:
+        print(line)
+    print(f"🔌 Groq HTTP client: {'HTTP/2' if HTTP2_ENABLED else 'HTTP/1.1'} keep-alive pool")
+    print(f"💾 Response cache: {response_cache.stats()}")
     print()
 
+def test_apis():
+    """Test both APIs to ensure they're working."""
+    print_api_status(check_apis())
+
+# Providers that can be selected with the 'switch' command
+MANUAL_PROVIDERS = {
+    'gemini': ("Gemini", ask_gemini),
+    'groq': ("Groq", ask_groq),
+}
+
 def main():
     print("=== Transcript Q&A with Dual API Support ===")
-    print("Primary: Gemini | Fallback: Groq\n")
-    
-    test_apis()
-    
-    file_path = input("Enter the path to your transcript file (txt preferred): ")
+    print("Auto mode: Gemini and Groq race, first answer wins\n")
+
+    # Check the APIs while the user is typing the file path; the result is
+    # printed once the transcript is loaded
+    api_check = _provider_pool.submit(check_apis)
+
+    file_path = input("Enter the path to your transcript file (txt, json or json.gz): ")
 
     transcript = read_transcript(file_path)
     if not transcript:
         print("Could not read transcript. Please check the file path and try again.")
         return
 
+    print()
+    print_api_status(api_check.result())
+
     print(f"\n✅ Transcript loaded successfully! ({len(transcript)} characters)")
     print("You can now ask questions about the transcript.")
     print("Commands:")
@@ -166,40 +461,36 @@ def main():
     print("  - Type 'test' to test API connections")
     print("  - Type 'switch' to manually choose API (groq/gemini)")
     
-    manual_mode = False
-    selected_api = None
+    selected_api = None  # None means automatic mode
 
     while True:
         question = input("\n💭 Enter your question: ")
+        command = question.strip().lower()
 
-        if question.lower() in ['quit', 'exit']:
+        if command in ('quit', 'exit'):
             print("👋 Goodbye!")
             break
-        
-        if question.lower() == 'test':
+
+        if command == 'test':
             test_apis()
             continue
-            
-        if question.lower() == 'switch':
-            api_choice = input("Choose API (groq/gemini/auto): ").lower()
-            if api_choice in ['groq', 'gemini']:
-                manual_mode = True
-                selected_api = api_choice
+
+        if command == 'switch':
+            api_choice = input("Choose API (groq/gemini/auto): ").strip().lower()
+            if api_choice in MANUAL_PROVIDERS:
+                selected_api = MANUAL_PROVIDERS[api_choice]
                 print(f"✅ Switched to {api_choice.upper()} only mode")
             elif api_choice == 'auto':
-                manual_mode = False
-                print("✅ Switched back to automatic fallback mode")
+                selected_api = None
+                print("✅ Switched back to automatic mode (Gemini and Groq race)")
             else:
                 print("❌ Invalid choice. Use 'groq', 'gemini', or 'auto'")
             continue
 
-        if manual_mode:
-            if selected_api == 'gemini':
-                print("🔄 Using Gemini API (manual mode)...")
-                answer = ask_gemini(transcript, question)
-            else:
-                print("🔄 Using Groq API (manual mode)...")
-                answer = ask_groq(transcript, question)
+        if selected_api:
+            name, ask = selected_api
+            print(f"🔄 Using {name} API (manual mode)...")
+            answer = ask(transcript, question)
         else:
             answer = ask_question_with_fallback(transcript, question)
 
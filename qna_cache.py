@@ -0,0 +1,145 @@
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_PUNCTUATION = ' ?!.'
+
+def normalize_question(question: str) -> str:
+    """
+    Reduce a question to the form used in cache keys
+
+    Case, repeated whitespace and trailing punctuation do not change what is
+    being asked, so "What is the main topic?" and "what is  the main topic"
+    share one cached answer.
+    """
+    return _WHITESPACE_RE.sub(' ', question).strip().rstrip(_TRAILING_PUNCTUATION).lower()
+
+class LLMCache:
+    """
+    Exact-match cache for LLM responses
+
+    Keeps recent answers in an in-memory LRU and, when a directory is given,
+    also on disk so they survive restarts (e.g. Streamlit reruns or a new
+    Q&A session on the same transcript). Disk entries are gzip-compressed,
+    like the extractor's caches. Entries expire after ttl seconds.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = ".llm_cache", ttl: float = 60 * 60, max_entries: int = 256):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for persisted entries (None keeps the cache in memory only)
+            ttl: Seconds an entry stays valid
+            max_entries: Number of entries kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def cache_key(self, model: str, transcript: str, question: str, temperature: float, max_tokens: int) -> str:
+        """
+        Build a deterministic key for one request
+
+        Args:
+            model: Model name the request is sent to
+            transcript: Transcript text used as context
+            question: User question (normalized with normalize_question)
+            temperature: Sampling temperature
+            max_tokens: Response length limit
+
+        Returns:
+            Hex SHA-256 digest of the request parameters
+        """
+        payload = {
+            'model': model,
+            'transcript': transcript,
+            'question': normalize_question(question),
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is not None and entry[0] > now:
+                self._remember(key, entry)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under key"""
+        entry = (time.time() + self.ttl, value)
+        with self._lock:
+            self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def stats(self) -> str:
+        """One-line hit/miss summary"""
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate)"
+
+    def _remember(self, key: str, entry) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def _read_disk(self, key: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with gzip.open(self._disk_path(key), 'rb') as f:
+                stored = json.loads(f.read())
+            return stored['expires_at'], stored['value']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, entry) -> None:
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # Created on first write, so importing a module that owns a cache
+            # leaves no empty directory behind
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = json.dumps({'expires_at': entry[0], 'value': entry[1]}, ensure_ascii=False).encode('utf-8')
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Could not write cache entry {key}: {e}")
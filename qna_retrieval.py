@@ -0,0 +1,113 @@
+import re
+import math
+import heapq
+import functools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from llm_utils import estimate_tokens
+
+CHUNK_WORDS = 150     # ~200 tokens per chunk
+CHUNK_OVERLAP = 30    # words shared with the previous chunk so answers are not cut in half
+TOP_K_CHUNKS = 4
+
+_TERM_RE = re.compile(r'\w+')
+
+@dataclass
+class TranscriptIndex:
+    chunks: List[str]
+    term_counts: List[Counter]
+    idf: Dict[str, float]
+
+def _terms(text: str) -> List[str]:
+    return _TERM_RE.findall(text.lower())
+
+@functools.lru_cache(maxsize=8)
+def build_index(transcript: str) -> TranscriptIndex:
+    """
+    Split a transcript into overlapping word windows and index their terms
+
+    The index is cached per transcript, so follow-up questions about the
+    same transcript only pay for scoring.
+
+    Args:
+        transcript: Plain transcript text
+
+    Returns:
+        TranscriptIndex with the chunks, their term counts and term IDF weights
+    """
+    words = transcript.split()
+    step = CHUNK_WORDS - CHUNK_OVERLAP
+    chunks = [' '.join(words[start:start + CHUNK_WORDS])
+              for start in range(0, max(len(words) - CHUNK_OVERLAP, 1), step)]
+
+    term_counts = [Counter(_terms(chunk)) for chunk in chunks]
+    doc_freq = Counter()
+    for counts in term_counts:
+        doc_freq.update(counts.keys())
+
+    # Terms found in every chunk get zero weight, so filler words do not
+    # decide which chunks are picked
+    idf = {term: math.log(len(chunks) / df) for term, df in doc_freq.items()}
+    return TranscriptIndex(chunks, term_counts, idf)
+
+def _leading_text(transcript: str, max_tokens: int) -> str:
+    """Opening of transcript, in whole CHUNK_WORDS - CHUNK_OVERLAP word steps, that fits in max_tokens"""
+    words = transcript.split()
+    step = CHUNK_WORDS - CHUNK_OVERLAP
+    pieces = []
+    used = 0
+    for start in range(0, len(words), step):
+        piece = ' '.join(words[start:start + step])
+        used += estimate_tokens(piece)
+        if used > max_tokens:
+            break
+        pieces.append(piece)
+    if not pieces:
+        # One "word" over the budget, e.g. unspaced CJK text; estimate_tokens
+        # counts at most one token per character, plus one
+        return transcript[:max(max_tokens - 1, 0)]
+    return ' '.join(pieces)
+
+def select_context(transcript: str, question: str, top_k: int = TOP_K_CHUNKS,
+                   max_tokens: Optional[int] = None) -> str:
+    """
+    Pick the parts of a transcript most relevant to a question
+
+    Transcripts that fit in max_tokens are returned unchanged, so the prompt
+    does not depend on the question. For longer ones only the top_k chunks
+    sharing the most distinctive terms with the question are kept, in their
+    original order. Questions that match nothing specific (e.g. "summarize
+    this") and transcripts of top_k chunks or fewer get the whole transcript,
+    or as much of its opening as fits in max_tokens.
+
+    Args:
+        transcript: Plain transcript text
+        question: User question
+        top_k: Number of chunks to keep
+        max_tokens: Estimated tokens the provider can take (None to always retrieve)
+
+    Returns:
+        Transcript text to put in the prompt
+    """
+    if max_tokens is not None and estimate_tokens(transcript) <= max_tokens:
+        return transcript
+
+    def whole_transcript() -> str:
+        return transcript if max_tokens is None else _leading_text(transcript, max_tokens)
+
+    index = build_index(transcript)
+    if len(index.chunks) <= top_k:
+        return whole_transcript()
+
+    question_terms = set(_terms(question))
+    scores = [
+        sum(index.idf.get(term, 0.0) * math.log1p(counts[term]) for term in question_terms if term in counts)
+        for counts in index.term_counts
+    ]
+    best = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+    if scores[best[0]] <= 0:
+        return whole_transcript()
+
+    return '\n...\n'.join(index.chunks[i] for i in sorted(best))
@@ -1,14 +1,19 @@
 from dotenv import load_dotenv
 import os
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()  # Will load environment variables from a .env file
 import streamlit as st
-from pathlib import Path
-import json
 
-from extract_transcript import YouTubeTranscriptExtractor
+from extract_transcript import YouTubeTranscriptExtractor, dumps_json, loads_json
 from summarize_json import TranscriptSummarizer
-from qna import ask_question_with_fallback, ask_gemini, ask_groq
+from qna_cache import LLMCache
+from qna import (
+    ask_question_with_fallback, ask_gemini, ask_groq, ask_questions, ask_groq_batch,
+    ask_question_stream, ask_gemini_stream, ask_groq_stream,
+)
 
 st.set_page_config(page_title="VideoIQ: AI Summarization & Q&A for YouTube Content", layout="wide")
 
@@ -107,16 +112,65 @@ st.markdown("""
 
 st.markdown('<div class="big-title">🎬 VideoIQ: AI Summarization & Q&A for YouTube Content</div>', unsafe_allow_html=True)
 st.write(
-    "Extract transcripts from YouTube, summarize with AI, and ask questions using Gemini or Groq (Llama 3), or use fallback mode (Gemini → Groq)."
+    "Extract transcripts from YouTube, summarize with AI, and ask questions using Gemini or Groq (Llama 3), or let both race and use whichever answers first."
 )
 
+PREVIEW_CHARS = 1000
+
 def get_plain_text_from_json_data(json_data):
     return json_data.get("transcript_plain", "")
 
+def transcript_preview(text):
+    """First PREVIEW_CHARS characters of a transcript, with an ellipsis only when cut."""
+    if len(text) <= PREVIEW_CHARS:
+        return text
+    return text[:PREVIEW_CHARS] + "..."
+
+def parse_uploaded_json(uploaded_file):
+    """
+    Parse an uploaded transcript JSON file, or show an error and return None
+
+    Only an object (as written by the extractor) is accepted; malformed JSON,
+    arrays and scalars are reported instead of raising.
+    """
+    try:
+        data = loads_json(uploaded_file.getvalue())
+    except ValueError as e:  # json and orjson decode errors (and bad UTF-8) subclass it
+        st.error(f"Could not read {uploaded_file.name}: not valid JSON ({e})")
+        return None
+    if not isinstance(data, dict):
+        st.error(f"Could not read {uploaded_file.name}: expected a transcript JSON object")
+        return None
+    return data
+
 # --- Review Storage ---
 if 'reviews' not in st.session_state:
     st.session_state['reviews'] = []
 
+@st.cache_data(max_entries=32)
+def render_reviews_html(reviews):
+    """
+    Build the HTML for the review list in one block, newest first
+
+    Cached on the reviews themselves, so reruns only rebuild it after a new
+    review is submitted. User text is escaped before it goes into the markup.
+    """
+    cards = []
+    for name, rating, review in reversed(reviews):
+        name_initial = html.escape(name[0].upper()) if name else ""
+        stars = "★" * rating + "☆" * (5 - rating)
+        content = html.escape(review) if review else '<span style="color:#888;">(No review)</span>'
+        cards.append(
+            '<div class="review-card">'
+            '<div class="review-header">'
+            f'<span class="review-name">{name_initial}</span>'
+            f'<span class="star-rating review-rating">{stars}</span>'
+            '</div>'
+            f'<div class="review-content">{content}</div>'
+            '</div>'
+        )
+    return '<div class="review-list"><div class="review-label">Recent Reviews</div>' + "".join(cards) + '</div>'
+
 def render_review_section(form_key):
     st.markdown(
         '<div style="margin-top:1.7em;"></div>'
@@ -141,49 +195,181 @@ def render_review_section(form_key):
                 st.success("Thank you for your feedback!")
 
     if st.session_state['reviews']:
-        st.markdown('<div class="review-list"><div class="review-label">Recent Reviews</div></div>', unsafe_allow_html=True)
-        for r in reversed(st.session_state['reviews']):
-            name_initial = r["name"][0].upper() if r["name"] else ""
-            stars = "★" * r['rating'] + "☆" * (5 - r['rating'])
-            review_html = f'''
-            <div class="review-card">
-                <div class="review-header">
-                    <span class="review-name">{name_initial}</span>
-                    <span class="star-rating review-rating">{stars}</span>
-                </div>
-                <div class="review-content">{r["review"] if r["review"] else '<span style="color:#888;">(No review)</span>'}</div>
-            </div>
-            '''
-            st.markdown(review_html, unsafe_allow_html=True)
+        reviews = tuple((r["name"], r["rating"], r["review"]) for r in st.session_state['reviews'])
+        st.markdown(render_reviews_html(reviews), unsafe_allow_html=True)
+
+@st.cache_resource
+def get_extractor():
+    """One extractor shared by all reruns and sessions, keeping its transcript-list cache warm"""
+    return YouTubeTranscriptExtractor()
+
+@st.cache_resource
+def get_summarizer():
+    """One summarizer for all reruns and sessions; it holds no per-request state"""
+    return TranscriptSummarizer(race_providers=True)
+
+@st.cache_resource
+def get_background_pool():
+    """Worker threads for summaries, so long LLM calls do not block reruns"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="summary")
+
+class SummaryJob:
+    """
+    A SummaryStream consumed on a worker thread
+
+    Reruns read the text received so far from parts; result is set once the
+    stream finishes. A cancelled job counts as done at once, and its stream
+    is closed, which also closes the provider's HTTP stream.
+    """
+
+    def __init__(self, summary_stream, transcript_key):
+        self.summary_stream = summary_stream
+        self.transcript_key = transcript_key
+        self.parts = []
+        self.done = False
+        self.cancelled = threading.Event()
+        self._chunks = iter(summary_stream)
+
+    def run(self):
+        try:
+            for chunk in self._chunks:
+                if self.cancelled.is_set():
+                    break
+                self.parts.append(chunk)
+        except ValueError:
+            # next() raced with cancel() closing the stream
+            if not self.cancelled.is_set():
+                raise
+        finally:
+            self._chunks.close()
+            self.done = True
+
+    def cancel(self):
+        self.cancelled.set()
+        self.done = True
+        try:
+            self._chunks.close()
+        except ValueError:
+            # The worker is waiting for the next chunk inside the stream;
+            # run() closes it as soon as that chunk arrives
+            pass
+
+    @property
+    def result(self):
+        return None if self.cancelled.is_set() else self.summary_stream.result
+
+@st.fragment(run_every=0.5)
+def show_summary_progress(job):
+    """
+    Redraw only the progress box while a summary runs
+
+    Runs as a fragment on a timer, so the rest of the page is not rerun while
+    waiting. Once the job ends (or is cancelled) the whole page reruns to show
+    the result.
+    """
+    if job.done:
+        st.rerun()
+    with st.status("Summarizing transcript...", state="running"):
+        st.write("".join(job.parts) or "Waiting for the first response...")
+    if st.button("Cancel"):
+        job.cancel()
+        st.rerun()
+
+class ExtractionError(Exception):
+    pass
+
+@st.cache_resource
+def get_extraction_cache():
+    """Extractions by URL (in memory only), shared by all reruns and sessions"""
+    return LLMCache(None, ttl=24 * 60 * 60, max_entries=64)
+
+def cached_extract(yt_url, progress_callback=None):
+    """
+    Extract a transcript once per URL and reuse it across reruns and sessions
+
+    Not st.cache_data: that would replay the progress elements on a cache hit
+    into a placeholder that no longer exists. Only successful extractions are
+    kept, so the next click after a failure tries YouTube again.
+
+    Args:
+        yt_url: YouTube video URL
+        progress_callback: Called with each extraction stage on a cache miss
+
+    Returns:
+        Transcript data; raises ExtractionError on failure
+    """
+    cache = get_extraction_cache()
+    cached = cache.get(yt_url)
+    if cached is not None:
+        return cached
+
+    # The app writes its own copy, so skip the extractor's timestamped file
+    success, message, data = get_extractor().extract_and_save(yt_url, save_to_disk=False,
+                                                              progress_callback=progress_callback)
+    if not success:
+        raise ExtractionError(message)
+    cache.set(yt_url, data)
+    return data
+
+def add_to_qna_history(pairs):
+    """Append question/answer pairs and prepend their markdown to the rendered history"""
+    st.session_state.qna_history.extend(pairs)
+    new_markdown = "".join(f"**Q:** {qa['question']}\n\n**A:** {qa['answer']}\n\n---\n\n" for qa in reversed(pairs))
+    st.session_state.qna_rendered = new_markdown + st.session_state.qna_rendered
+
+# Q&A model choice -> (blocking ask, streaming ask)
+API_DISPATCH = {
+    "Default (fastest of Gemini / Groq)": (ask_question_with_fallback, ask_question_stream),
+    "Gemini only": (ask_gemini, ask_gemini_stream),
+    "Groq only": (ask_groq, ask_groq_stream),
+}
 
 tab1, tab2, tab3 = st.tabs(["1️⃣ Extract Transcript", "2️⃣ Summarize", "3️⃣ Q&A"])
 
 # Step 1: Extract Transcript
 with tab1:
     st.markdown('<div class="section-header">Step 1: Extract YouTube Transcript</div>', unsafe_allow_html=True)
-    yt_url = st.text_input("Enter YouTube video URL:")
     if 'transcript_extracted' not in st.session_state:
         st.session_state['transcript_extracted'] = False
-    extract_btn = st.button("Extract and Save Transcript")
-    extractor = YouTubeTranscriptExtractor()
+    # A form only reruns the script on submit, not on every edit of the URL
+    with st.form("extract_form"):
+        yt_url = st.text_input("Enter YouTube video URL:")
+        extract_btn = st.form_submit_button("Extract and Save Transcript")
     if extract_btn and yt_url:
         with st.spinner("Extracting transcript..."):
-            success, message, data = extractor.extract_and_save(yt_url)
+            progress = st.empty()
+            try:
+                data = cached_extract(yt_url.strip(), progress_callback=progress.caption)
+                success = True
+            except ExtractionError as e:
+                success, message = False, str(e)
+            progress.empty()
             if success:
                 st.success("Transcript extracted and saved!")
                 st.session_state['transcript_extracted'] = True
-                st.write(message)
                 video_id = data["video_id"]
                 json_filename = f"{video_id}_streamlit.json"
                 os.makedirs("transcripts", exist_ok=True)
                 json_path = os.path.join("transcripts", json_filename)
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                # Serialized once (with orjson when available) for both the file and the download
+                json_bytes = dumps_json(data)
+                with open(json_path, "wb") as f:
+                    f.write(json_bytes)
+                # The extractor did not save this copy; report the app's own file
+                st.write(get_extractor().success_message(data, f"Saved to: {json_path}"))
                 st.session_state['last_transcript_json_path'] = json_path
                 st.session_state['last_transcript_data'] = data
                 st.session_state['transcript_data'] = data  # for QnA compatibility
-                st.download_button("Download Transcript JSON", data=json.dumps(data, ensure_ascii=False, indent=2), file_name=json_filename)
-                st.text_area("Transcript Preview", data.get("transcript_plain", "")[:1000] + "...")
+                st.download_button("Download Transcript JSON", data=json_bytes, file_name=json_filename, mime="application/json")
+                # Only a short preview goes to the browser; the full text is a download
+                with st.expander("Show transcript preview"):
+                    st.text_area("Transcript Preview", transcript_preview(get_plain_text_from_json_data(data)), disabled=True)
+                st.download_button(
+                    "Download full transcript (txt)",
+                    data=get_plain_text_from_json_data(data),
+                    file_name=f"{video_id}.txt",
+                    mime="text/plain",
+                )
             else:
                 st.session_state['transcript_extracted'] = False
                 st.error(message)
@@ -194,27 +380,40 @@ with tab2:
     st.markdown('<div class="section-header">Step 2: Summarize Transcript</div>', unsafe_allow_html=True)
     st.write("Upload a transcript JSON file (from Step 1) to summarize, or use the last extracted transcript.")
 
-    transcript_available = False
-    json_path = None
     data = None
+    transcript_key = None
 
-    if 'last_transcript_json_path' in st.session_state and Path(st.session_state['last_transcript_json_path']).exists():
-        transcript_available = True
-        json_path = st.session_state['last_transcript_json_path']
-        data = st.session_state.get('last_transcript_data')
+    # Summarize straight from memory; the transcript is never re-read from disk
+    if st.session_state.get('last_transcript_data'):
+        data = st.session_state['last_transcript_data']
+        json_path = st.session_state.get('last_transcript_json_path', '')
+        transcript_key = data.get("video_id") or json_path
         st.success(f"Using last extracted transcript: {os.path.basename(json_path)}")
     else:
         uploaded_json = st.file_uploader("Choose transcript JSON file", type="json")
         if uploaded_json:
-            json_path = f"temp_uploaded_{uploaded_json.name}"
-            with open(json_path, "wb") as f:
-                f.write(uploaded_json.getbuffer())
-            transcript_available = True
-
-    if transcript_available and json_path:
-        summarizer = TranscriptSummarizer()
-        with st.spinner("Summarizing transcript..."):
-            result = summarizer.process_transcript(json_path)
+            data = parse_uploaded_json(uploaded_json)
+            if data:
+                transcript_key = data.get("video_id") or uploaded_json.name
+
+    if data:
+        job = st.session_state.get('summary_job')
+        if job is not None and job.transcript_key != transcript_key:
+            job = None  # belongs to a different transcript
+
+        # The summary runs on a worker thread; this rerun (and every other
+        # interaction meanwhile) only reads its progress
+        running = job is not None and not job.done
+        if st.button("Summarize Transcript", disabled=running):
+            job = SummaryJob(get_summarizer().stream_transcript_data(data), transcript_key)
+            get_background_pool().submit(job.run)
+            st.session_state['summary_job'] = job
+            running = True
+
+        if running:
+            show_summary_progress(job)
+        elif job is not None:
+            result = job.result
             if result:
                 st.success("Summary generated!")
                 st.write(f"**Title:** {result.title}")
@@ -222,8 +421,9 @@ with tab2:
                 st.write("### Summary")
                 st.write(result.summary)
                 st.write("### Key Points")
-                for i, kp in enumerate(result.key_points, 1):
-                    st.write(f"{i}. {kp}")
+                st.markdown("\n".join(f"{i}. {kp}" for i, kp in enumerate(result.key_points, 1)))
+            elif job.cancelled.is_set():
+                st.info("Summary cancelled.")
             else:
                 st.error("Failed to summarize transcript.")
 
@@ -236,6 +436,8 @@ with tab3:
 
     if 'qna_history' not in st.session_state:
         st.session_state.qna_history = []
+        # Rendered once per new pair, newest first, so reruns do not rebuild it
+        st.session_state.qna_rendered = ""
 
     transcript_text = ""
     json_data = None
@@ -257,48 +459,71 @@ with tab3:
                 transcript_text = qna_file.read().decode("utf-8")
                 st.session_state.transcript_data = {"transcript_plain": transcript_text}
             elif file_type == "json":
-                json_data = json.load(qna_file)
-                transcript_text = get_plain_text_from_json_data(json_data)
-                st.session_state.transcript_data = json_data
+                json_data = parse_uploaded_json(qna_file)
+                if json_data:
+                    transcript_text = get_plain_text_from_json_data(json_data)
+                    st.session_state.transcript_data = json_data
 
     if transcript_text:
         with st.expander("Click to watch transcript preview"):
-            st.text_area("Transcript Preview", transcript_text[:1000]+"...", height=200, key="preview_area")
+            st.text_area("Transcript Preview", transcript_preview(transcript_text), height=200, key="preview_area")
 
         st.header("3. Ask Questions about the Transcript")
-        st.write("Ask any question about the transcript. Choose your preferred AI model or let the app try Gemini first, then Groq if needed.")
+        st.write("Ask any question about the transcript. Choose your preferred AI model or let the app ask Gemini and Groq together and use the first answer.")
 
         qna_input = st.text_input("Your Question", key="qna_input")        
 
         api_choice = st.radio(
             "Choose AI Model",
-            ("Default (Gemini → Groq fallback)", "Gemini only", "Groq only"),
+            tuple(API_DISPATCH),
             horizontal=True
         )
+        ask_fn, stream_fn = API_DISPATCH[api_choice]
 
         if st.button("Ask Question"):
             transcript = st.session_state.transcript_data.get("transcript_plain", "")
             answer = None
             if transcript and qna_input.strip():
-                with st.spinner("Generating answer..."):
-                    if api_choice.startswith("Default"):
-                        answer = ask_question_with_fallback(transcript, qna_input)
-                    elif api_choice == "Gemini only":
-                        answer = ask_gemini(transcript, qna_input)
-                    elif api_choice == "Groq only":
-                        answer = ask_groq(transcript, qna_input)
-                st.session_state.qna_history.append({"question": qna_input, "answer": answer})
+                # Renders tokens as they arrive and returns the full text
+                answer = st.write_stream(stream_fn(transcript, qna_input)) or None
+                if not answer:
+                    st.error("❌ Sorry, I couldn't generate an answer. Please try again.")
+                add_to_qna_history([{"question": qna_input, "answer": answer}])
             elif not transcript:
                 st.error("No transcript loaded. Please extract or upload a transcript first.")
             elif not qna_input.strip():
                 st.error("Please enter a question.")
 
+        with st.expander("Batch ask"):
+            batch_input = st.text_area("Enter questions (one per line)", key="qna_batch_input")
+            single_request = st.checkbox(
+                "Send all questions in one Groq request (transcript is sent once)", key="qna_batch_single"
+            )
+            if st.button("Batch Ask"):
+                transcript = st.session_state.transcript_data.get("transcript_plain", "")
+                questions = [q.strip() for q in batch_input.splitlines() if q.strip()]
+                if transcript and questions:
+                    with st.spinner(f"Answering {len(questions)} questions..."):
+                        if single_request:
+                            answers = ask_groq_batch(transcript, questions)
+                            # Anything the combined answer missed is asked on its own
+                            missing = [i for i, a in enumerate(answers) if not a]
+                            for i, a in zip(missing, ask_questions(transcript, [questions[i] for i in missing], ask=ask_fn)):
+                                answers[i] = a
+                        else:
+                            answers = ask_questions(transcript, questions, ask=ask_fn)
+                    batch_results = [{"question": q, "answer": a} for q, a in zip(questions, answers)]
+                    add_to_qna_history(batch_results)
+                    st.table(batch_results)
+                elif not transcript:
+                    st.error("No transcript loaded. Please extract or upload a transcript first.")
+                else:
+                    st.error("Please enter at least one question.")
+
         if st.session_state.qna_history:
             st.subheader("Q&A History")
-            for qa in reversed(st.session_state.qna_history):
-                st.markdown(f"**Q:** {qa['question']}")
-                st.write(f"**A:** {qa['answer']}")
-                st.markdown("---")
+            # One markdown element for the whole history instead of three per pair
+            st.markdown(st.session_state.qna_rendered)
 
     render_review_section("review_form_tab3")
 
@@ -1,15 +1,122 @@
 from dataclasses import dataclass
 import os
+import sys
+import gzip
+import mmap
 import json
 import re
 import time
+import heapq
+import threading
+import textwrap
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import Generator, Iterator, List, Dict, Tuple, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from llm_utils import (MAX_INPUT_TOKENS, call_with_retry, estimate_prompt_tokens, estimate_tokens, get_http_client,
+                       get_rate_limiter)
+from qna_cache import LLMCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Install required packages:
 # pip install google-generativeai groq
 
+# Providers that call a remote API; only these take part in a race
+API_PROVIDERS = ('gemini', 'groq')
+
+# Chunk summaries requested at once when a transcript is too long for one prompt
+MAP_CONCURRENCY = 5
+
+# Transcript files summarized at once in batch mode
+BATCH_CONCURRENCY = 5
+
+# Re-running on the same transcript (batch retries, reopening a video in the
+# app) reuses the stored response instead of calling the API again
+SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60
+
+# (model, temperature, max_tokens) of the final summary request per provider;
+# every summary call and its cache key read them from here
+SUMMARY_REQUESTS = {
+    'gemini': ('gemini-1.5-flash', None, None),  # the model's defaults
+    'groq': ('llama-3.3-70b-versatile', 0.7, 2000),
+}
+
+# Gemini's default output cap, counted against its token rate limit when a
+# request leaves max_tokens unset
+GEMINI_MAX_OUTPUT_TOKENS = 8192
+
+# The instructions are identical for every transcript and go first (Groq
+# system message, first Gemini part) with the video and transcript after them,
+# so the providers can serve that prefix from their prompt caches
+SUMMARY_TASKS = {
+    'gemini': """Analyze this YouTube video transcript and provide:
+
+1. A comprehensive summary (3-4 paragraphs) covering the main content
+2. Key takeaways as bullet points (5-8 important points)""",
+    'groq': """Analyze this YouTube video transcript and create:
+
+1. A detailed summary (3-4 paragraphs) that captures the essence and main flow
+2. Key insights as bullet points (5-8 most important takeaways)""",
+}
+
+# Non-streaming calls ask for JSON so the reply needs no line-by-line parsing;
+# streamed replies are shown as they arrive and keep the readable text layout
+JSON_RESPONSE_FORMAT = """Respond with a JSON object with exactly these keys:
+"summary": the summary as one string, paragraphs separated by blank lines
+"key_points": array of strings, one per key point"""
+
+TEXT_RESPONSE_FORMATS = {
+    'gemini': """Format response as:
+SUMMARY:
+[Summary text]
+
+KEY POINTS:
+• [Point 1]
+• [Point 2]""",
+    'groq': """Response format:
+SUMMARY:
+[Your comprehensive summary]
+
+KEY POINTS:
+• [Key insight 1]
+• [Key insight 2]""",
+}
+
+_SENTENCE_END_RE = re.compile(r'[.!?。！？]+')  # CJK full stops too
+_WORD_RE = re.compile(r'\w+')
+_NUMBERED_POINT_RE = re.compile(r'^[•\-\*\d+\.]\s*')
+_BULLET_POINT_RE = re.compile(r'^[•\-\*]\s*')
+
+def read_transcript_json(json_file_path: str) -> Dict:
+    """
+    Parse a transcript JSON file written by the extractor
+
+    Args:
+        json_file_path: Path to a .json or gzip-compressed .json.gz file
+
+    Returns:
+        The extractor result dict (errors are raised to the caller)
+    """
+    compressed = json_file_path.lower().endswith('.gz')
+    if orjson is not None and not compressed:
+        # Parse straight from the memory-mapped file, without first
+        # copying a multi-megabyte transcript into a bytes object
+        with open(json_file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            return orjson.loads(view)
+
+    opener = gzip.open if compressed else open
+    with opener(json_file_path, 'rb') as f:
+        raw = f.read()
+    # orjson parses large transcripts several times faster than the stdlib
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 @dataclass
 class SummaryResult:
     """Data class to store summary results"""
@@ -27,59 +134,83 @@ class TranscriptSummarizer:
     Multi-API transcript summarizer using Groq and Gemini AI services
     """
 
-    def __init__(self, storage_dir: str = "summaries"):
+    def __init__(self, storage_dir: str = "summaries", race_providers: bool = False):
+        """
+        Initialize the summarizer
+
+        Args:
+            storage_dir: Directory where summaries are saved (cached responses go in its .cache folder)
+            race_providers: Query all preferred API providers at once and keep the first
+                answer, instead of trying them one after another
+        """
         self.storage_dir = storage_dir
+        self.race_providers = race_providers
         self.ensure_storage_dir()
+        self.response_cache = LLMCache(os.path.join(storage_dir, ".cache"), ttl=SUMMARY_CACHE_TTL)
+
+        # Provider clients are built once per summarizer (see _gemini_model, _groq_client),
+        # not for every chunk and summary request
+        self._clients = {}
+        self._clients_lock = threading.Lock()
 
         # API configurations - Add your API keys here
         self.api_configs = {
             'gemini': {
                 'api_key': os.getenv('GEMINI_API_KEY', ''),
-                'model': 'gemini-1.5-flash',  # Free tier
-                'max_tokens': 8000
+                'max_input_tokens': MAX_INPUT_TOKENS['gemini']
             },
             'groq': {
                 'api_key': os.getenv('GROQ_API_KEY', ''),
-                'model': 'llama3-8b-8192',  # Free tier
-                'max_tokens': 8000
+                'max_input_tokens': MAX_INPUT_TOKENS['groq']
             }
         }
 
     def ensure_storage_dir(self):
         """Create storage directory if it doesn't exist"""
-        if not os.path.exists(self.storage_dir):
-            os.makedirs(self.storage_dir)
+        os.makedirs(self.storage_dir, exist_ok=True)
 
     def load_transcript_from_json(self, json_file_path: str) -> Tuple[str, Dict]:
         """
         Load transcript from JSON file created by the extractor
 
         Args:
-            json_file_path: Path to JSON transcript file
+            json_file_path: Path to JSON transcript file (.json or gzip-compressed .json.gz)
 
         Returns:
             Tuple of (transcript_text, metadata)
         """
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            transcript_text = data.get('transcript_plain', '')
-            metadata = {
-                'title': data.get('metadata', {}).get('title', 'Unknown Title'),
-                'duration_minutes': data.get('duration_minutes', 0),
-                'word_count': data.get('word_count', 0),
-                'video_id': data.get('video_id', ''),
-                'url': data.get('url', ''),
-                'segment_count': data.get('segment_count', 0)
-            }
-
-            return transcript_text, metadata
+            return self.load_transcript_from_data(read_transcript_json(json_file_path))
 
         except Exception as e:
             print(f"Error loading transcript: {str(e)}")
             return "", {}
 
+    def load_transcript_from_data(self, data: Dict) -> Tuple[str, Dict]:
+        """
+        Read the transcript text and metadata from an extractor result dict
+
+        Args:
+            data: Transcript data as returned by YouTubeTranscriptExtractor.extract_and_save
+
+        Returns:
+            Tuple of (transcript_text, metadata)
+        """
+        transcript_text = data.get('transcript_plain')
+        if transcript_text is None:
+            # Slim files (store_text_fields=False) only keep the raw segments
+            transcript_text = " ".join(segment.get('text', '') for segment in data.get('transcript_raw', []))
+        metadata = {
+            'title': data.get('metadata', {}).get('title', 'Unknown Title'),
+            'duration_minutes': data.get('duration_minutes', 0),
+            'word_count': data.get('word_count', 0),
+            'video_id': data.get('video_id', ''),
+            'url': data.get('url', ''),
+            'segment_count': data.get('segment_count', 0)
+        }
+
+        return transcript_text, metadata
+
     def chunk_text(self, text: str, max_chunk_size: int = 3000) -> List[str]:
         """
         Split text into chunks for processing by AI APIs
@@ -95,77 +226,70 @@ class TranscriptSummarizer:
             return [text]
 
         # Split by sentences first
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_END_RE.split(text)
         chunks = []
-        current_chunk = ""
+        # Sentences of the chunk being built and its joined length; joining
+        # once per chunk avoids re-copying the growing string for every sentence
+        current_chunk = []
+        current_length = 0
 
         for sentence in sentences:
             sentence = sentence.strip()
             if not sentence:
                 continue
 
+            # Auto-generated captions often have no punctuation at all; break a
+            # sentence that alone exceeds the limit on word boundaries (text
+            # without spaces, e.g. Chinese, is cut at the limit instead)
+            if len(sentence) > max_chunk_size:
+                if current_chunk:
+                    chunks.append(". ".join(current_chunk))
+                    current_chunk, current_length = [], 0
+                chunks.extend(textwrap.wrap(sentence, max_chunk_size, break_long_words=True, break_on_hyphens=False))
+                continue
+
             # If adding this sentence would exceed limit, start new chunk
-            if len(current_chunk) + len(sentence) + 2 > max_chunk_size:
+            if current_length + len(sentence) + 2 > max_chunk_size:
                 if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
+                    chunks.append(". ".join(current_chunk))
+                current_chunk, current_length = [sentence], len(sentence)
             else:
-                current_chunk += ". " + sentence if current_chunk else sentence
+                current_length += len(sentence) + 2 if current_chunk else len(sentence)
+                current_chunk.append(sentence)
 
         # Add the last chunk
         if current_chunk:
-            chunks.append(current_chunk.strip())
+            chunks.append(". ".join(current_chunk))
 
         return chunks
 
     def summarize_with_gemini(self, text: str, metadata: Dict) -> Optional[SummaryResult]:
         """Summarize using Google Gemini"""
         try:
-            import google.generativeai as genai
-
-            api_key = self.api_configs['gemini']['api_key']
-            if not api_key:
+            if not self.api_configs['gemini']['api_key']:
                 print("Gemini API key not found. Set GEMINI_API_KEY environment variable.")
                 return None
 
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('gemini-1.5-flash')
-
-            prompt = f"""
-            Analyze this YouTube video transcript and provide:
-
-            1. A comprehensive summary (3-4 paragraphs) covering the main content
-            2. Key takeaways as bullet points (5-8 important points)
-
-            Video: {metadata.get('title', 'Unknown')} ({metadata.get('duration_minutes', 0)} minutes)
-
-            Transcript:
-            {text}
-
-            Format response as:
-            SUMMARY:
-            [Summary text]
-
-            KEY POINTS:
-            • [Point 1]
-            • [Point 2]
-            """
-
             start_time = time.time()
-            response = model.generate_content(prompt)
+            cache_key = self._summary_cache_key('gemini', text, metadata, json_response=True)
+            response_text = self.response_cache.get(cache_key)
+            if response_text is None:
+                model = self._gemini_model()
+                text = self._condense('gemini', text)
+                contents = self._gemini_contents(text, metadata, json_response=True)
+                response = call_with_retry(
+                    model.generate_content,
+                    contents,
+                    rate_limiter=get_rate_limiter('gemini'),
+                    tokens=estimate_prompt_tokens(contents) + GEMINI_MAX_OUTPUT_TOKENS,
+                    generation_config={"response_mime_type": "application/json"}
+                )
+                response_text = response.text
+                if response_text:
+                    self.response_cache.set(cache_key, response_text)
             processing_time = time.time() - start_time
 
-            summary, key_points = self._parse_ai_response(response.text)
-
-            return SummaryResult(
-                title=metadata.get('title', 'Unknown'),
-                duration=f"{metadata.get('duration_minutes', 0)} minutes",
-                word_count=metadata.get('word_count', 0),
-                summary=summary,
-                key_points=key_points,
-                ai_provider="Google Gemini",
-                processing_time=processing_time
-            )
+            return self._build_result(response_text, metadata, "Google Gemini", processing_time)
 
         except Exception as e:
             print(f"Gemini summarization failed: {str(e)}")
@@ -174,63 +298,238 @@ class TranscriptSummarizer:
     def summarize_with_groq(self, text: str, metadata: Dict) -> Optional[SummaryResult]:
         """Summarize using Groq (very fast, free tier available)"""
         try:
-            from groq import Groq
-
-            api_key = self.api_configs['groq']['api_key']
-            if not api_key:
+            if not self.api_configs['groq']['api_key']:
                 print("Groq API key not found. Set GROQ_API_KEY environment variable.")
                 return None
 
-            client = Groq(api_key=api_key)
-
-            prompt = f"""
-            Analyze this YouTube video transcript and create:
-
-            1. A detailed summary (3-4 paragraphs) that captures the essence and main flow
-            2. Key insights as bullet points (5-8 most important takeaways)
-
-            Video: "{metadata.get('title', 'Unknown')}" ({metadata.get('duration_minutes', 0)} minutes)
-
-            Transcript:
-            {text}
-
-            Response format:
-            SUMMARY:
-            [Your comprehensive summary]
-
-            KEY POINTS:
-            • [Key insight 1]
-            • [Key insight 2]
-            """
-
             start_time = time.time()
-
-            completion = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                max_tokens=2000,
-                temperature=0.7
-            )
+            cache_key = self._summary_cache_key('groq', text, metadata, json_response=True)
+            content = self.response_cache.get(cache_key)
+            if content is None:
+                client = self._groq_client()
+                text = self._condense('groq', text)
+                messages = self._groq_messages(text, metadata, json_response=True)
+                model, temperature, max_tokens = SUMMARY_REQUESTS['groq']
+
+                completion = call_with_retry(
+                    client.chat.completions.create,
+                    rate_limiter=get_rate_limiter('groq'),
+                    tokens=estimate_prompt_tokens(messages) + max_tokens,
+                    messages=messages,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    response_format={"type": "json_object"}
+                )
+                content = completion.choices[0].message.content
+                if content:
+                    self.response_cache.set(cache_key, content)
 
             processing_time = time.time() - start_time
-            content = completion.choices[0].message.content
-
-            summary, key_points = self._parse_ai_response(content)
 
-            return SummaryResult(
-                title=metadata.get('title', 'Unknown'),
-                duration=f"{metadata.get('duration_minutes', 0)} minutes",
-                word_count=metadata.get('word_count', 0),
-                summary=summary,
-                key_points=key_points,
-                ai_provider="Groq Llama3",
-                processing_time=processing_time
-            )
+            return self._build_result(content, metadata, "Groq Llama3", processing_time)
 
         except Exception as e:
             print(f"Groq summarization failed: {str(e)}")
             return None
 
+    def stream_with_gemini(self, text: str, metadata: Dict) -> Iterator[str]:
+        """Stream the raw Gemini summary response as it is generated"""
+        cache_key = self._summary_cache_key('gemini', text, metadata)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        model = self._gemini_model()
+        text = self._condense('gemini', text)
+
+        contents = self._gemini_contents(text, metadata)
+        parts = []
+        for chunk in call_with_retry(model.generate_content, contents, rate_limiter=get_rate_limiter('gemini'),
+                                     tokens=estimate_prompt_tokens(contents) + GEMINI_MAX_OUTPUT_TOKENS,
+                                     stream=True):
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+        # Only reached when the stream was read to the end (not cancelled or lost a race)
+        if parts:
+            self.response_cache.set(cache_key, "".join(parts))
+
+    def stream_with_groq(self, text: str, metadata: Dict) -> Iterator[str]:
+        """Stream the raw Groq summary response as it is generated"""
+        cache_key = self._summary_cache_key('groq', text, metadata)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        client = self._groq_client()
+        text = self._condense('groq', text)
+        messages = self._groq_messages(text, metadata)
+        model, temperature, max_tokens = SUMMARY_REQUESTS['groq']
+
+        stream = call_with_retry(
+            client.chat.completions.create,
+            rate_limiter=get_rate_limiter('groq'),
+            tokens=estimate_prompt_tokens(messages) + max_tokens,
+            messages=messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        parts = []
+        try:
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    yield content
+        finally:
+            # Also runs when the caller closes this generator early (cancelled, lost a race)
+            stream.close()
+        if parts:
+            self.response_cache.set(cache_key, "".join(parts))
+
+    def _summary_cache_key(self, provider: str, text: str, metadata: Dict, json_response: bool = False) -> str:
+        """
+        Cache key for a provider's summary of a transcript
+
+        Built from the prompt for the full transcript, so a hit also skips the
+        map step for long transcripts, and editing a prompt template starts
+        from a fresh cache.
+        """
+        prompt = "\n\n".join((self._summary_instructions(provider, json_response), self._summary_input(text, metadata)))
+        model, temperature, max_tokens = SUMMARY_REQUESTS[provider]
+        return self.response_cache.cache_key(model, prompt, 'summary', temperature, max_tokens)
+
+    def _gemini_model(self):
+        """Gemini model handle, created on first use and shared by later calls"""
+        with self._clients_lock:
+            if 'gemini' not in self._clients:
+                import google.generativeai as genai
+
+                api_key = self.api_configs['gemini']['api_key']
+                if not api_key:
+                    raise ValueError("Gemini API key not found. Set GEMINI_API_KEY environment variable.")
+
+                genai.configure(api_key=api_key)
+                self._clients['gemini'] = genai.GenerativeModel(SUMMARY_REQUESTS['gemini'][0])
+            return self._clients['gemini']
+
+    def _groq_client(self):
+        """Groq client, created on first use and shared by later calls"""
+        with self._clients_lock:
+            if 'groq' not in self._clients:
+                from groq import Groq
+
+                api_key = self.api_configs['groq']['api_key']
+                if not api_key:
+                    raise ValueError("Groq API key not found. Set GROQ_API_KEY environment variable.")
+
+                # call_with_retry handles retries
+                self._clients['groq'] = Groq(api_key=api_key, http_client=get_http_client(), max_retries=0)
+            return self._clients['groq']
+
+    def _complete(self, provider: str, prompt: str) -> str:
+        """Send a single prompt to provider and return the response text"""
+        if provider == 'gemini':
+            return call_with_retry(self._gemini_model().generate_content, prompt,
+                                   rate_limiter=get_rate_limiter('gemini'),
+                                   tokens=estimate_tokens(prompt) + GEMINI_MAX_OUTPUT_TOKENS).text
+
+        completion = call_with_retry(
+            self._groq_client().chat.completions.create,
+            rate_limiter=get_rate_limiter('groq'),
+            tokens=estimate_tokens(prompt) + 1000,
+            messages=[{"role": "user", "content": prompt}],
+            model=SUMMARY_REQUESTS['groq'][0],
+            max_tokens=1000,
+            temperature=0.3
+        )
+        return completion.choices[0].message.content
+
+    def _condense(self, provider: str, text: str) -> str:
+        """
+        Shrink a transcript that is too long for one provider request (map step)
+
+        The transcript is split into chunks that each fit one request, the
+        chunks are summarized concurrently, and the partial summaries, in
+        transcript order, replace the transcript for the final summary call.
+
+        Args:
+            provider: Provider that will receive the text ('gemini' or 'groq')
+            text: Transcript text
+
+        Returns:
+            The text unchanged if it fits, otherwise the joined chunk summaries
+        """
+        limit = self.api_configs[provider]['max_input_tokens']
+        tokens = estimate_tokens(text)
+        if tokens <= limit:
+            return text
+
+        # Budgets are in tokens; convert to characters at this text's own
+        # ratio, which is much lower for e.g. Chinese than for English
+        chunks = self.chunk_text(text, max_chunk_size=max(1, len(text) * limit // tokens))
+        print(f"Transcript too long for one {provider.upper()} request, summarizing {len(chunks)} parts first...")
+
+        def summarize_part(numbered_chunk):
+            number, chunk = numbered_chunk
+            return self._complete(provider, (
+                f"This is part {number} of {len(chunks)} of a YouTube video transcript. "
+                "Summarize it in one dense paragraph, keeping names, numbers and key claims.\n\n"
+                f"{chunk}"
+            ))
+
+        with ThreadPoolExecutor(max_workers=min(MAP_CONCURRENCY, len(chunks))) as executor:
+            partials = list(executor.map(summarize_part, enumerate(chunks, 1)))
+
+        condensed = "\n\n".join(f"[Part {number}] {partial.strip()}" for number, partial in enumerate(partials, 1))
+        condensed_tokens = estimate_tokens(condensed)
+        if condensed_tokens <= limit:
+            return condensed
+        # Very long videos may need a second pass; stop if it no longer shrinks
+        if len(condensed) < len(text):
+            return self._condense(provider, condensed)
+        return condensed[:len(condensed) * limit // condensed_tokens]
+
+    def _summary_instructions(self, provider: str, json_response: bool = False) -> str:
+        """The constant part of a summary prompt: the task and the response format"""
+        response_format = JSON_RESPONSE_FORMAT if json_response else TEXT_RESPONSE_FORMATS[provider]
+        return f"{SUMMARY_TASKS[provider]}\n\n{response_format}"
+
+    def _summary_input(self, text: str, metadata: Dict) -> str:
+        """The per-video part of a summary prompt"""
+        title = metadata.get('title', 'Unknown')
+        duration = metadata.get('duration_minutes', 0)
+        return f'Video: "{title}" ({duration} minutes)\n\nTranscript:\n{text}'
+
+    def _gemini_contents(self, text: str, metadata: Dict, json_response: bool = False) -> List[str]:
+        return [self._summary_instructions('gemini', json_response), self._summary_input(text, metadata)]
+
+    def _groq_messages(self, text: str, metadata: Dict, json_response: bool = False) -> List[Dict]:
+        return [
+            {"role": "system", "content": self._summary_instructions('groq', json_response)},
+            {"role": "user", "content": self._summary_input(text, metadata)},
+        ]
+
+    def _build_result(self, response_text: str, metadata: Dict, ai_provider: str, processing_time: float) -> SummaryResult:
+        """Parse a raw AI response (JSON or the text layout) into a SummaryResult"""
+        parsed = self._parse_json_response(response_text)
+        summary, key_points = parsed if parsed else self._parse_ai_response(response_text)
+
+        return SummaryResult(
+            title=metadata.get('title', 'Unknown'),
+            duration=f"{metadata.get('duration_minutes', 0)} minutes",
+            word_count=metadata.get('word_count', 0),
+            summary=summary,
+            key_points=key_points,
+            ai_provider=ai_provider,
+            processing_time=processing_time
+        )
+
     def summarize_with_local_extractive(self, text: str, metadata: Dict) -> Optional[SummaryResult]:
         """
         Fallback: Simple extractive summarization (no API required)
@@ -239,26 +538,31 @@ class TranscriptSummarizer:
         try:
             start_time = time.time()
 
-            # Clean and split into sentences
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+            # Clean and split into sentences, tokenizing each one once. Word
+            # frequencies count every sentence (short ones too), which is the
+            # same as counting over the whole text without a lowercased copy of it
+            sentences = []
+            sentence_words = []
+            word_freq = Counter()
+            for sentence in _SENTENCE_END_RE.split(text):
+                words_in_sentence = _WORD_RE.findall(sentence.lower())
+                word_freq.update(words_in_sentence)
+                sentence = sentence.strip()
+                if len(sentence) > 20:
+                    sentences.append(sentence)
+                    sentence_words.append(words_in_sentence)
 
             if len(sentences) < 5:
                 return None
 
-            # Calculate word frequencies
-            words = re.findall(r'\w+', text.lower())
-            word_freq = Counter(words)
-
-            # Score sentences based on word frequencies
-            sentence_scores = {}
-            for i, sentence in enumerate(sentences):
-                words_in_sentence = re.findall(r'\w+', sentence.lower())
-                score = sum(word_freq[word] for word in words_in_sentence)
-                sentence_scores[i] = score / len(words_in_sentence) if words_in_sentence else 0
+            # Score sentences based on word frequencies (mean frequency of their words)
+            sentence_scores = []
+            for words_in_sentence in sentence_words:
+                score = sum(map(word_freq.__getitem__, words_in_sentence))
+                sentence_scores.append(score / len(words_in_sentence) if words_in_sentence else 0)
 
-            # Get top sentences for summary
-            top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)
+            # Get top sentences for summary; only the 11 used below need ordering
+            top_sentences = heapq.nlargest(11, enumerate(sentence_scores), key=lambda x: x[1])
             summary_sentences = [sentences[i] for i, _ in top_sentences[:5]]
             summary = ". ".join(summary_sentences) + "."
 
@@ -281,6 +585,21 @@ class TranscriptSummarizer:
             print(f"Local summarization failed: {str(e)}")
             return None
 
+    def _parse_json_response(self, response_text: str) -> Optional[Tuple[str, List[str]]]:
+        """Read summary and key points from a JSON-mode response, or None if it is not one"""
+        try:
+            data = orjson.loads(response_text) if orjson is not None else json.loads(response_text)
+        except (TypeError, ValueError):  # json and orjson decode errors both subclass ValueError
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get('summary'), str):
+            return None
+
+        key_points = data.get('key_points') or []
+        if isinstance(key_points, str):
+            key_points = key_points.split('\n')
+        key_points = [_BULLET_POINT_RE.sub('', str(point).strip()) for point in key_points]
+        return data['summary'].strip(), [point for point in key_points if point]
+
     def _parse_ai_response(self, response_text: str) -> Tuple[str, List[str]]:
         """Parse AI response to extract summary and key points"""
         try:
@@ -309,7 +628,7 @@ class TranscriptSummarizer:
                     summary += line + " "
                 elif current_section == 'points':
                     # Clean bullet points
-                    clean_point = re.sub(r'^[•\-\*\d+\.]\s*', '', line)
+                    clean_point = _NUMBERED_POINT_RE.sub('', line)
                     if clean_point:
                         key_points.append(clean_point)
 
@@ -324,7 +643,7 @@ class TranscriptSummarizer:
                     line = line.strip()
                     if line.startswith('•') or line.startswith('-') or line.startswith('*'):
                         is_points_section = True
-                        clean_point = re.sub(r'^[•\-\*]\s*', '', line)
+                        clean_point = _BULLET_POINT_RE.sub('', line)
                         if clean_point:
                             point_lines.append(clean_point)
                     elif not is_points_section and line:
@@ -352,9 +671,99 @@ class TranscriptSummarizer:
         """
         # Load transcript
         transcript_text, metadata = self.load_transcript_from_json(json_file_path)
+        return self._summarize_transcript(transcript_text, metadata, preferred_providers)
+
+    def process_transcripts(self, json_file_paths: List[str], preferred_providers: List[str] = None,
+                            max_workers: int = BATCH_CONCURRENCY,
+                            save: bool = False) -> Iterator[Tuple[str, Optional[SummaryResult]]]:
+        """
+        Process several transcript files concurrently
 
+        Each file spends nearly all its time waiting on the provider API, so
+        max_workers files are summarized at once instead of one after another.
+
+        Args:
+            json_file_paths: Paths to transcript JSON files
+            preferred_providers: List of preferred AI providers to try
+            max_workers: Number of files processed at the same time
+            save: Also save each summary (see save_summary) on the worker that produced it,
+                so writing one file's results overlaps with the other files' API calls
+
+        Returns:
+            Iterator of (json_file_path, SummaryResult or None) in completion order
+        """
+        if not json_file_paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(json_file_paths)),
+                                thread_name_prefix="summary-batch") as executor:
+            futures = {executor.submit(self._process_and_save if save else self.process_transcript,
+                                       path, preferred_providers): path
+                       for path in json_file_paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Error processing {path}: {str(e)}")
+                    result = None
+                yield path, result
+
+    def _process_and_save(self, json_file_path: str, preferred_providers: List[str] = None) -> Optional[SummaryResult]:
+        result = self.process_transcript(json_file_path, preferred_providers)
+        if result:
+            # Extractor file names start with the video ID
+            self.save_summary(result, os.path.basename(json_file_path).split('_')[0])
+        return result
+
+    def process_transcript_data(self, data: Dict, preferred_providers: List[str] = None) -> Optional[SummaryResult]:
+        """
+        Same as process_transcript, for transcript data already in memory
+
+        Lets callers that just ran the extractor summarize its result without
+        writing it to a JSON file first.
+
+        Args:
+            data: Transcript data as returned by YouTubeTranscriptExtractor.extract_and_save
+            preferred_providers: List of preferred AI providers to try
+
+        Returns:
+            SummaryResult object or None if all methods fail
+        """
+        transcript_text, metadata = self.load_transcript_from_data(data)
+        return self._summarize_transcript(transcript_text, metadata, preferred_providers)
+
+    def stream_transcript(self, json_file_path: str, preferred_providers: List[str] = None) -> 'SummaryStream':
+        """
+        Streaming version of process_transcript
+
+        Args:
+            json_file_path: Path to transcript JSON file
+            preferred_providers: List of preferred AI providers to try
+
+        Returns:
+            SummaryStream yielding the response text; its result is set once it is exhausted
+        """
+        transcript_text, metadata = self.load_transcript_from_json(json_file_path)
+        return SummaryStream(self, transcript_text, metadata, preferred_providers)
+
+    def stream_transcript_data(self, data: Dict, preferred_providers: List[str] = None) -> 'SummaryStream':
+        """
+        Streaming version of process_transcript_data
+
+        Args:
+            data: Transcript data as returned by YouTubeTranscriptExtractor.extract_and_save
+            preferred_providers: List of preferred AI providers to try
+
+        Returns:
+            SummaryStream yielding the response text; its result is set once it is exhausted
+        """
+        transcript_text, metadata = self.load_transcript_from_data(data)
+        return SummaryStream(self, transcript_text, metadata, preferred_providers)
+
+    def _summarize_transcript(self, transcript_text: str, metadata: Dict, preferred_providers: List[str] = None) -> Optional[SummaryResult]:
+        """Try each provider in order on a loaded transcript"""
         if not transcript_text:
-            print("No transcript text found in JSON file")
+            print("No transcript text found in transcript data")
             return None
 
         print(f"Processing: {metadata.get('title', 'Unknown')}")
@@ -372,6 +781,15 @@ class TranscriptSummarizer:
             'local': self.summarize_with_local_extractive
         }
 
+        if self.race_providers:
+            racing = [p for p in preferred_providers if p in API_PROVIDERS]
+            if len(racing) > 1:
+                result = self._race_providers(racing, transcript_text, metadata, provider_methods)
+                if result:
+                    return result
+                # Only the non-API fallbacks (e.g. local) are left to try
+                preferred_providers = [p for p in preferred_providers if p not in racing]
+
         # Try each provider
         for provider in preferred_providers:
             if provider not in provider_methods:
@@ -394,9 +812,34 @@ class TranscriptSummarizer:
         print("All AI providers failed")
         return None
 
+    def _race_providers(self, providers: List[str], transcript_text: str, metadata: Dict,
+                        provider_methods: Dict) -> Optional[SummaryResult]:
+        """Run providers concurrently and return the first complete summary"""
+        print(f"\nRacing {', '.join(p.upper() for p in providers)}...")
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        futures = {executor.submit(provider_methods[p], transcript_text, metadata): p for p in providers}
+        # Do not wait for the slower providers once a winner is known
+        executor.shutdown(wait=False)
+
+        for future in as_completed(futures):
+            provider = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"✗ {provider.upper()} failed: {str(e)}")
+                continue
+            if result and result.summary:
+                print(f"✓ {provider.upper()} answered first")
+                print(f"  Processing time: {result.processing_time:.2f} seconds")
+                return result
+            print(f"✗ {provider.upper()} returned no results")
+
+        return None
+
     def save_summary(self, result: SummaryResult, video_id: str = None) -> str:
         """Save summary result to file"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime('%Y%m%d_%H%M%S')
         filename = f"summary_{video_id}_{timestamp}.json" if video_id else f"summary_{timestamp}.json"
         filepath = os.path.join(self.storage_dir, filename)
 
@@ -409,37 +852,179 @@ class TranscriptSummarizer:
             'key_points': result.key_points,
             'ai_provider': result.ai_provider,
             'processing_time': result.processing_time,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at.isoformat(),
             'ready_for_qa': True
         }
 
         # Save JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(summary_data, f, indent=2, ensure_ascii=False)
 
-        # Also save as readable text
+        # Also save as readable text, built up front and written in one call
         text_filepath = filepath.replace('.json', '.txt')
+        lines = [
+            f"Title: {result.title}",
+            f"Duration: {result.duration}",
+            f"AI Provider: {result.ai_provider}",
+            f"Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 50,
+            "",
+            "SUMMARY:",
+            "-" * 20,
+            result.summary,
+            "",
+            "KEY POINTS:",
+            "-" * 20,
+        ]
+        lines.extend(f"{i}. {point}" for i, point in enumerate(result.key_points, 1))
         with open(text_filepath, 'w', encoding='utf-8') as f:
-            f.write(f"Title: {result.title}\n")
-            f.write(f"Duration: {result.duration}\n")
-            f.write(f"AI Provider: {result.ai_provider}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 50 + "\n\n")
-
-            f.write("SUMMARY:\n")
-            f.write("-" * 20 + "\n")
-            f.write(result.summary + "\n\n")
-
-            f.write("KEY POINTS:\n")
-            f.write("-" * 20 + "\n")
-            for i, point in enumerate(result.key_points, 1):
-                f.write(f"{i}. {point}\n")
+            f.write("\n".join(lines) + "\n")
 
         print(f"Summary saved to: {filepath}")
         print(f"Text version saved to: {text_filepath}")
 
         return filepath
 
+class SummaryStream:
+    """
+    Summary response streamed from the first provider that answers
+
+    Iterating yields the raw response text as it is generated (for example
+    into st.write_stream). Once exhausted, result holds the parsed
+    SummaryResult, or None if every provider failed. Providers are only
+    switched before any text has been yielded.
+    """
+
+    def __init__(self, summarizer: TranscriptSummarizer, transcript_text: str, metadata: Dict,
+                 preferred_providers: List[str] = None):
+        self.summarizer = summarizer
+        self.transcript_text = transcript_text
+        self.metadata = metadata
+        self.providers = preferred_providers or ['gemini', 'groq', 'local']
+        self.result: Optional[SummaryResult] = None
+
+    def __iter__(self) -> Iterator[str]:
+        if not self.transcript_text:
+            print("No transcript text found in transcript data")
+            return
+
+        stream_methods = {
+            'gemini': (self.summarizer.stream_with_gemini, "Google Gemini"),
+            'groq': (self.summarizer.stream_with_groq, "Groq Llama3"),
+        }
+
+        providers = self.providers
+        if self.summarizer.race_providers:
+            racing = [p for p in providers if p in stream_methods]
+            if len(racing) > 1:
+                if (yield from self._race(racing, stream_methods)):
+                    # The winner's text is already out, even if it failed part way
+                    return
+                providers = [p for p in providers if p not in racing]
+
+        for provider in providers:
+            print(f"\nTrying {provider.upper()}...")
+
+            if provider == 'local':
+                # Extractive summaries are computed in one go, show them whole
+                result = self.summarizer.summarize_with_local_extractive(self.transcript_text, self.metadata)
+                if result and result.summary:
+                    self.result = result
+                    points = "\n".join(f"• {point}" for point in result.key_points)
+                    yield f"SUMMARY:\n{result.summary}\n\nKEY POINTS:\n{points}"
+                    return
+                print(f"✗ {provider.upper()} returned no results")
+                continue
+
+            if provider not in stream_methods:
+                continue
+
+            stream_method, ai_provider = stream_methods[provider]
+            start_time = time.time()
+            parts = []
+            chunks = stream_method(self.transcript_text, self.metadata)
+            try:
+                for chunk in chunks:
+                    parts.append(chunk)
+                    yield chunk
+            except Exception as e:
+                print(f"✗ {provider.upper()} failed: {str(e)}")
+                if parts:
+                    # Part of this answer is already on screen; do not append another provider's
+                    return
+                continue
+            finally:
+                chunks.close()
+
+            if parts:
+                self.result = self.summarizer._build_result("".join(parts), self.metadata, ai_provider,
+                                                            time.time() - start_time)
+                print(f"✓ Success with {provider.upper()}")
+                return
+            print(f"✗ {provider.upper()} returned no results")
+
+        print("All AI providers failed")
+
+    def _race(self, providers: List[str], stream_methods: Dict) -> Generator[str, None, bool]:
+        """
+        Start every provider's stream and continue with the first one to produce text
+
+        Returns:
+            Whether any text was yielded (False when no provider answered)
+        """
+        print(f"\nRacing {', '.join(p.upper() for p in providers)}...")
+        streams = {p: stream_methods[p][0](self.transcript_text, self.metadata) for p in providers}
+        start_time = time.time()
+
+        executor = ThreadPoolExecutor(max_workers=len(streams))
+        futures = {executor.submit(_first_chunk, p, stream): p for p, stream in streams.items()}
+        executor.shutdown(wait=False)
+
+        winner = first_chunk = None
+        for future in as_completed(futures):
+            provider = futures[future]
+            first_chunk = future.result()
+            if first_chunk:
+                winner = provider
+                break
+            streams[provider].close()
+
+        if winner is None:
+            return False
+
+        # Close the slower streams as soon as they produce their first chunk
+        for future, provider in futures.items():
+            if provider != winner:
+                future.add_done_callback(lambda _, stream=streams[provider]: stream.close())
+
+        print(f"✓ {winner.upper()} answered first")
+        parts = [first_chunk]
+        try:
+            yield first_chunk
+            for chunk in streams[winner]:
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"✗ {winner.upper()} failed: {str(e)}")
+            return True
+        finally:
+            streams[winner].close()
+
+        self.result = self.summarizer._build_result("".join(parts), self.metadata, stream_methods[winner][1],
+                                                    time.time() - start_time)
+        return True
+
+def _first_chunk(provider: str, stream: Iterator[str]) -> Optional[str]:
+    try:
+        return next(stream, None)
+    except Exception as e:
+        print(f"✗ {provider.upper()} failed: {str(e)}")
+        return None
+
 def setup_api_keys():
     """
     Helper function to set up API keys
@@ -458,14 +1043,20 @@ def setup_api_keys():
     print()
     print("Note: Local extractive method works without any API keys")
 
-def main():
+def main(race_providers: bool = False):
     """
     Interactive main function
+
+    Args:
+        race_providers: Query the API providers at the same time and keep the first summary
+            (pass --race on the command line)
     """
     print("YouTube Transcript Summarizer")
     print("=" * 40)
+    if race_providers:
+        print("Racing API providers: the first complete summary is used")
 
-    summarizer = TranscriptSummarizer()
+    summarizer = TranscriptSummarizer(race_providers=race_providers)
 
     while True:
         print("\nOptions:")
@@ -499,7 +1090,12 @@ def main():
                 providers = None
 
             print("\nProcessing...")
-            result = summarizer.process_transcript(json_path, providers)
+            # Print the summary as it is generated instead of after the whole response
+            summary_stream = summarizer.stream_transcript(json_path, providers)
+            for chunk in summary_stream:
+                print(chunk, end="", flush=True)
+            print()
+            result = summary_stream.result
 
             if result:
                 print("\n" + "=" * 50)
@@ -509,15 +1105,6 @@ def main():
                 print(f"PROCESSING TIME: {result.processing_time:.2f}s")
                 print("=" * 50)
 
-                print("\nSUMMARY:")
-                print("-" * 20)
-                print(result.summary)
-
-                print("\nKEY POINTS:")
-                print("-" * 20)
-                for i, point in enumerate(result.key_points, 1):
-                    print(f"{i}. {point}")
-
                 # Save results
                 video_id = os.path.basename(json_path).split('_')[0]
                 summarizer.save_summary(result, video_id)
@@ -534,25 +1121,21 @@ def main():
                 print(f"Directory not found: {input_dir}")
                 continue
 
-            json_files = [f for f in os.listdir(input_dir) if f.endswith('.json')]
+            json_files = [f for f in os.listdir(input_dir) if f.endswith(('.json', '.json.gz'))]
 
             if not json_files:
                 print(f"No JSON files found in {input_dir}")
                 continue
 
-            print(f"Found {len(json_files)} JSON files to process")
-
-            for json_file in json_files:
-                json_path = os.path.join(input_dir, json_file)
-                print(f"\nProcessing: {json_file}")
+            print(f"Found {len(json_files)} JSON files to process ({BATCH_CONCURRENCY} at a time)")
 
-                result = summarizer.process_transcript(json_path)
+            json_paths = [os.path.join(input_dir, json_file) for json_file in json_files]
+            for json_path, result in summarizer.process_transcripts(json_paths, save=True):
+                json_file = os.path.basename(json_path)
                 if result:
-                    video_id = json_file.split('_')[0]
-                    summarizer.save_summary(result, video_id)
-                    print("✓ Completed")
+                    print(f"✓ Completed: {json_file}")
                 else:
-                    print("✗ Failed")
+                    print(f"✗ Failed: {json_file}")
 
         elif choice == '3':
             setup_api_keys()
@@ -568,4 +1151,4 @@ def main():
             print("Invalid choice. Please enter 1-5.")
 
 if __name__ == "__main__":
-    main()
+    main(race_providers="--race" in sys.argv[1:])
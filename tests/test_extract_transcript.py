@@ -0,0 +1,37 @@
+import tempfile
+import unittest
+
+from extract_transcript import YouTubeTranscriptExtractor
+
+
+class ExtractVideoIdTest(unittest.TestCase):
+    def setUp(self):
+        self._storage = tempfile.TemporaryDirectory()
+        self.addCleanup(self._storage.cleanup)
+        self.extractor = YouTubeTranscriptExtractor(storage_dir=self._storage.name)
+
+    def test_youtube_url_formats(self):
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ?t=42",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "youtube.com/watch?v=dQw4w9WgXcQ",
+        ]
+
+        self.assertEqual(self.extractor.extract_video_ids(urls), ["dQw4w9WgXcQ"] * len(urls))
+
+    def test_non_youtube_url_is_rejected(self):
+        self.assertIsNone(self.extractor.extract_video_id("https://example.com/watch?v=abcdefghijk"))
+        self.assertIsNone(self.extractor.extract_video_id("https://example.com/embed/abcdefghijk"))
+        self.assertIsNone(self.extractor.extract_video_id("https://notyoutube.com/v/abcdefghijk"))
+
+    def test_one_result_per_url(self):
+        urls = ["https://youtu.be/dQw4w9WgXcQ", "not a url", "https://example.com/watch?v=abcdefghijk"]
+
+        self.assertEqual(self.extractor.extract_video_ids(urls), ["dQw4w9WgXcQ", None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from llm_utils import estimate_tokens
+from qna_retrieval import select_context
+
+
+class SelectContextTest(unittest.TestCase):
+    def test_transcript_within_budget_is_unchanged(self):
+        transcript = " ".join(f"word{i % 300}" for i in range(3000))
+
+        self.assertEqual(select_context(transcript, "what is word5?", max_tokens=6000), transcript)
+
+    def test_over_budget_without_matching_terms_is_cut_to_budget(self):
+        transcript = " ".join(f"word{i}" for i in range(20000))
+
+        context = select_context(transcript, "summarize this", max_tokens=6000)
+
+        self.assertLessEqual(estimate_tokens(context), 6000)
+        self.assertTrue(transcript.startswith(context))
+
+    def test_over_budget_with_few_chunks_is_cut_to_budget(self):
+        transcript = "".join(f"応答{i}" for i in range(5000))  # no spaces, a single chunk
+
+        context = select_context(transcript, "応答", max_tokens=100)
+
+        self.assertLessEqual(estimate_tokens(context), 100)
+        self.assertTrue(transcript.startswith(context))
+
+    def test_over_budget_with_matching_terms_keeps_relevant_chunks(self):
+        transcript = " ".join("needle" if i == 10000 else f"word{i}" for i in range(20000))
+
+        context = select_context(transcript, "where is the needle?", max_tokens=6000)
+
+        self.assertIn("needle", context)
+        self.assertLessEqual(estimate_tokens(context), 6000)
+
+
+if __name__ == '__main__':
+    unittest.main()
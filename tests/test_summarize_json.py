@@ -0,0 +1,50 @@
+import time
+import unittest
+from types import SimpleNamespace
+
+from summarize_json import SummaryStream
+
+
+def _failing_stream(text, metadata):
+    yield "A1"
+    raise RuntimeError("connection dropped")
+
+
+def _slow_stream(text, metadata):
+    time.sleep(0.2)
+    yield "B1"
+
+
+def _local_summary(text, metadata):
+    return SimpleNamespace(summary="local extractive", key_points=["point"])
+
+
+class SummaryStreamRaceTest(unittest.TestCase):
+    def _summarizer(self, gemini, groq):
+        return SimpleNamespace(
+            race_providers=True,
+            stream_with_gemini=gemini,
+            stream_with_groq=groq,
+            summarize_with_local_extractive=_local_summary,
+            _build_result=lambda text, metadata, provider, elapsed: SimpleNamespace(summary=text),
+        )
+
+    def test_winner_failing_mid_stream_does_not_fall_back(self):
+        stream = SummaryStream(self._summarizer(_failing_stream, _slow_stream), "transcript", {})
+
+        self.assertEqual(list(stream), ["A1"])
+        self.assertIsNone(stream.result)
+
+    def test_no_answer_falls_back_to_local(self):
+        def empty_stream(text, metadata):
+            yield from ()
+
+        stream = SummaryStream(self._summarizer(empty_stream, empty_stream), "transcript", {})
+
+        chunks = list(stream)
+        self.assertEqual(len(chunks), 1)
+        self.assertIn("local extractive", chunks[0])
+
+
+if __name__ == '__main__':
+    unittest.main()